@@ -20,37 +20,37 @@ USAGE EXAMPLES:
   python redfin_scraper.py --send-email        # Actually sends email (requires setup)
   python redfin_scraper.py --no-email          # Just creates files, no email
   python redfin_scraper.py --send-email --provider outlook  # Use different email provider
-  python redfin_scraper.py --schedule          # Run daily at 10am PST (24-hour automation)
+  python redfin_scraper.py --schedule          # Keep running and send every 3 days at 10am PST
   python redfin_scraper.py --limit 10          # Process only first 10 properties (testing)
 
+SCHEDULING:
+  Prefer one-shot runs triggered by the OS or CI over the long-running --schedule loop,
+  so nothing stays resident between reports:
+    GitHub Actions: .github/workflows/redfin-scraper.yml (see GITHUB_ACTIONS_SETUP.md)
+    cron:           0 10 * * * cd /opt/redfin && /usr/bin/python3 redfin_scraper.py --send-email
+    systemd:        a oneshot service running the command above + an OnCalendar=10:00 timer
+
 EMAIL SETUP:
   For Outlook/Hotmail (easiest): set EMAIL_ADDRESS=you@outlook.com & EMAIL_PASSWORD=yourpassword
   For Gmail (harder): Requires app password setup
 """
 
-import argparse, datetime as dt, logging, re, time, os, warnings
-import smtplib
-import schedule
-import pytz
-from email.mime.multipart import MIMEMultipart
-from email.mime.text import MIMEText
-from email.mime.base import MIMEBase
-from email import encoders
+import argparse, datetime as dt, hashlib, logging, operator, re, time, os
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
+from itertools import islice
+from string import Template
 from pathlib import Path
+from zoneinfo import ZoneInfo
 
+import numpy as np
+import orjson
 import pandas as pd
 import requests
+import requests_cache
 from requests.adapters import HTTPAdapter
 from requests.packages.urllib3.util.retry import Retry
-from bs4 import BeautifulSoup
-
-# Suppress CSS selector warnings from BeautifulSoup
-warnings.filterwarnings("ignore", message=".*pseudo class.*deprecated.*", category=FutureWarning)
-from reportlab.lib.pagesizes import letter, landscape
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, PageBreak
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib.units import inch
-from reportlab.lib import colors
+from selectolax.lexbor import LexborHTMLParser
 
 # ───── logging ────────────────────────────────────────────────────────────────
 logging.basicConfig(
@@ -61,6 +61,8 @@ logging.basicConfig(
 
 # ───── constants ──────────────────────────────────────────────────────────────
 HDRS          = {"User-Agent": "Mozilla/5.0"}
+# (connect, read) seconds: an unreachable host fails fast, slow SCOUT pages still get time
+HTTP_TIMEOUT  = (10, 45)
 
 # Multiple Redfin URLs for different jurisdictions
 # Note: Spokane Valley will be filtered out later
@@ -77,12 +79,67 @@ REDFIN_SOURCES = {
 }
 
 SLUG_RE       = re.compile(r"/WA/Spokane/([^/]+)/home")
+SLUG_CITY_RE  = re.compile(r"\sSPOKANE|\sWA\s")   # street part ends before the city/state
+SLUG_ZIP_RE   = re.compile(r"\s\d{5}$")
+
+# "$450,000" / "$1.25M" / "$450K" on a Redfin card
+PRICE_RE      = re.compile(r"(\$)?([\d,]+(?:\.\d+)?)\s*([MK])?")
+PRICE_MULTIPLIERS = {None: 1, "K": 1000, "M": 1000000}
+
+# "1,850 Sq Ft" / "1850 square feet" / "1850 SF" on a Redfin card
+SQFT_RE       = re.compile(r"([\d,]+)\s*(?:[Ss]q\s*[Ff]t|[Ss]quare\s*[Ff]eet|SF\b)")
+
+# Lot size on a Redfin card, tried in order; the flag marks square-foot patterns
+CARD_LOT_SIZE_PATTERNS = [
+    (re.compile(r'([\d,]+)\s*sq\s*ft\s*lot', re.IGNORECASE), True),    # "6,534 sq ft lot"
+    (re.compile(r'([\d.]+)\s*acres?\s*lot', re.IGNORECASE), False),     # "0.5 acres lot"
+    (re.compile(r'([\d.]+)\s*acres?(?:\s|$)', re.IGNORECASE), False),   # "0.5 acres"
+    (re.compile(r'Lot.*?([\d,]+)\s*sq.*?ft', re.IGNORECASE), True),     # "Lot size 6,534 sq ft"
+    (re.compile(r'Lot.*?([\d.]+)\s*acres?', re.IGNORECASE), False),     # "Lot: 0.5 acres"
+]
+SQFT_PER_ACRE = 43560
+
+# clean_date_string: strip everything but digits and separators, then check the shape
+DATE_JUNK_RE  = re.compile(r'[^\d/\-]')
+SLASH_DATE_RE = re.compile(r'\d{1,2}/\d{1,2}/\d{4}')
+DASH_DATE_RE  = re.compile(r'\d{1,2}-\d{1,2}-\d{4}')
+
+# Listing-date patterns for extract_post_date_from_card, compiled once at import
+DAYS_ON_RE      = re.compile(r"(\d+)\s+days?\s+on\s+(?:Redfin|market)"      # "5 days on Redfin"
+                             r"|On\s+(?:Redfin|market)\s+(\d+)\s+days?",     # "On market 5 days"
+                             re.IGNORECASE)
+STATUS_BADGE_RE = re.compile(r"(?:NEW|LISTED)\s+(TODAY|YESTERDAY)"             # "NEW TODAY"
+                             r"|NEW\s+(\d+)\s+(HOURS?|HRS?|MINUTES?|MINS?|DAYS?)\s+AGO"  # "NEW 2 HRS AGO"
+                             r"|LISTED\s+(\d+)\s+(DAYS?)\s+AGO"
+                             r"|NEW\s+A\s+FEW\s+MINUTES?\s+AGO|(?:JUST|RECENTLY)\s+LISTED",
+                             re.IGNORECASE)
+MONTHS          = {m: i for i, m in enumerate(["JAN", "FEB", "MAR", "APR", "MAY", "JUN",
+                                                  "JUL", "AUG", "SEP", "OCT", "NOV", "DEC"], 1)}
+EXPLICIT_DATE_RE = re.compile(r"(\d{1,2}/\d{1,2}/\d{4}|\d{1,2}-\d{1,2}-\d{4})"     # "12/25/2024"
+                              r"|(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+(\d{1,2}),?\s+(\d{4})",
+                              re.IGNORECASE)
+RECENCY_RE      = re.compile(r"\b(?:NEW|JUST\s+LISTED|RECENTLY\s+LISTED|FRESH\s+LISTING"
+                             r"|PRICE\s+IMPROVEMENT|PRICE\s+REDUCED|BACK\s+ON\s+MARKET)\b",
+                             re.IGNORECASE)
 
 SCOUT_LAYER   = ("https://gismo.spokanecounty.org/arcgis/rest/services/"
                  "SCOUT/PropertyLookup/MapServer/0/query")
 SCOUT_SUMMARY = ("https://cp.spokanecounty.org/SCOUT/propertyinformation/"
                  "Summary.aspx?PID={} ")
 
+# SCOUT land size: "1.3 Acre(s)" or "6540 Square Feet"
+SCOUT_LOT_SIZE_RE = re.compile(r"(\d+\.?\d*)\s+Acre\(s\)|(\d+)\s+Square Feet")
+# SCOUT jurisdiction: city name right before the land size, then the tax code area
+SCOUT_CITY_RE     = re.compile(r"Site Address\s+([A-Z\s]+?)\s+(?:\d+\s+Square Feet|\d+\.?\d*\s+Acre)")
+SCOUT_TAX_CODE_RE = re.compile(r"Tax Code Area Status.*?(\d{4})")
+# SCOUT living area: "Dwelling 1959 1,920 NA SF", else "Gross Living Area 1,920"
+SCOUT_DWELLING_RE = re.compile(r'Dwelling\s+\d{4}\s+([\d,]+)\s+NA\s+SF', re.IGNORECASE)
+SCOUT_GROSS_RE    = re.compile(r'Gross\s+Living\s+Area\s+([\d,]+)', re.IGNORECASE)
+# Legal description: the section of a SCOUT summary page between "Active" and "Appraisal"
+LEGAL_DESC_RE     = re.compile(r"Active(.*?)Appraisal", re.DOTALL)
+# Legal descriptions for short/long plats are filtered out of the report
+PLAT_RE           = re.compile(r"SHORT PLAT|LONG PLAT", re.IGNORECASE)
+
 # Updated keywords per Aaron's requirements
 KEYWORDS_BASE = [
     " LT","LTS"," L ","LOTS","THRU"," TO ",
@@ -90,7 +147,39 @@ KEYWORDS_BASE = [
     "THROUGH","&",
     # ">=1500","RANCH",">=1500&RANCH"  # Commented out - not needed for keyword analysis
 ]
-KEYWORDS      = KEYWORDS_BASE + [f"L{i}" for i in range(100)]   # L0 … L99
+LOT_KEYWORDS  = [f"L{i}" for i in range(100)]                   # L0 … L99
+KEYWORDS      = KEYWORDS_BASE + LOT_KEYWORDS
+KEYWORD_SET   = frozenset(KEYWORDS)                             # O(1) column membership
+ZERO_LOTS     = dict.fromkeys(LOT_KEYWORDS, 0)                  # Lot counts before a scan
+KEYWORD_COLUMNS = {k: "TO" if k == " TO " else k for k in KEYWORDS_BASE}
+# Column order of the keyword count block (the order enhanced_kw_counts fills its dict)
+KEYWORD_COUNT_COLUMNS = [*KEYWORD_COLUMNS.values(), *LOT_KEYWORDS, "-"]
+
+# Lot references. Both patterns start with a literal "L" so the regex engine can
+# skip ahead to candidates, and findall keeps the per-match work in C.
+# Every "L<separators><digits>" run; runs without "&" are dash references
+LOT_RUN_RE      = re.compile(r"L([-\s&]*)\d+")
+# Standalone lot numbers, i.e. \bL[-\s&]*\d{1,2}\b written with the boundary checks
+# as lookarounds after the "L"
+LOT_NUMBER_RE   = re.compile(r"L(?<!\wL)[-\s&]*(\d{1,2})(?!\w)")
+
+# SCOUT lookups run concurrently; keep the pool small to stay polite to the county servers
+SCOUT_MAX_WORKERS = 10
+# Streets resolved per PropertyLookup query (OR'ed site_address LIKE clauses). The
+# where clause for a full batch runs to ~2.8 KB, so it is sent as a POST body
+# rather than a GET query string that proxies may cap at 2 KB
+SCOUT_BATCH_SIZE  = 50
+# Pages of a truncated batch result to read before falling back to single-street queries
+SCOUT_BATCH_MAX_PAGES = 5
+
+# On-disk HTTP cache for SCOUT responses (parcel PIDs and summaries barely change day to day)
+SCOUT_CACHE_PATH   = Path(__file__).with_name("scout_cache")   # -> scout_cache.sqlite
+SCOUT_CACHE_EXPIRE = dt.timedelta(days=7)
+
+# --schedule mode: send a report every REPORT_INTERVAL_DAYS at REPORT_HOUR:00 Pacific time
+REPORT_TIMEZONE      = "America/Los_Angeles"
+REPORT_HOUR          = 10
+REPORT_INTERVAL_DAYS = 3
 
 # Email configuration
 SMTP_SERVER = "smtp.gmail.com"
@@ -104,29 +193,76 @@ EMAIL_PROVIDERS = {
     'aol': {'smtp': 'smtp.aol.com', 'port': 587, 'requires_app_password': False}
 }
 
+# Hash and paths of the last written report, so unchanged data is not re-rendered
+LAST_REPORT_PATH = Path(__file__).with_name("last_report.json")
+# Columns left out of that hash: days on market ticks up for every live listing
+# between runs, and the result page a listing lands on shifts as others come and go
+REPORT_VOLATILE_COLUMNS = ["days_on_market", "source"]
+
+# Long PDF tables are emitted in chunks of this many rows (about one landscape page)
+PDF_TABLE_CHUNK_ROWS = 30
+
 # ───── helpers ────────────────────────────────────────────────────────────────
 
+def is_cacheable_response(response) -> bool:
+    """Keep ArcGIS error payloads (served as HTTP 200) out of the SCOUT cache."""
+    return not response.url.startswith(SCOUT_LAYER) or b'"features"' in response.content
+
 def create_robust_session():
-    """Create a requests session with retry logic and timeout handling."""
-    session = requests.Session()
+    """Create a requests session with retry logic, timeout handling and an on-disk SCOUT cache."""
+    # Only SCOUT hosts are cached; Redfin listing pages are always fetched fresh
+    session = requests_cache.CachedSession(
+        str(SCOUT_CACHE_PATH),
+        backend="sqlite",
+        expire_after=requests_cache.DO_NOT_CACHE,
+        urls_expire_after={"*.spokanecounty.org": SCOUT_CACHE_EXPIRE},
+        filter_fn=is_cacheable_response,
+        # Batched PID lookups are POSTed; the cache key includes the form body
+        allowable_methods=("GET", "HEAD", "POST"),
+    )
     
     # Define retry strategy
     retry_strategy = Retry(
         total=3,                # Total number of retries
         backoff_factor=1,       # Wait time between retries (1s, 2s, 4s)
         status_forcelist=[429, 500, 502, 503, 504],  # HTTP status codes to retry on
+        # The only POST is the read-only SCOUT batch query, so it is safe to retry too
+        allowed_methods=Retry.DEFAULT_ALLOWED_METHODS | {"POST"},
         raise_on_status=False   # Don't raise exception on HTTP errors
     )
     
-    # Mount adapter with retry strategy
-    adapter = HTTPAdapter(max_retries=retry_strategy)
+    # Mount adapter with retry strategy; pools are sized for the concurrent
+    # Redfin/SCOUT fetchers so sockets to the same host are kept alive and reused
+    adapter = HTTPAdapter(max_retries=retry_strategy,
+                          pool_connections=32, pool_maxsize=64, pool_block=False)
     session.mount("http://", adapter)
     session.mount("https://", adapter)
+
+    # Default headers for every request made through the session
+    session.headers.update(HDRS)
+    session.headers["Connection"] = "keep-alive"
     
     return session
 
 # Global session for reuse
 ROBUST_SESSION = create_robust_session()
+
+def parse_html(html: str | bytes) -> LexborHTMLParser:
+    """Parse an HTML document with the Lexbor backend (shared by Redfin and SCOUT)."""
+    return LexborHTMLParser(html)
+
+def scout_page_text(html: str | bytes) -> str:
+    """Return the visible text of a SCOUT summary page, one text node per line.
+
+    The whole page is kept: the legal description, lot size, square footage and
+    keyword counts are all read from different parts of it.
+    """
+    tree = parse_html(html)
+    # Lexbor keeps <script>/<style> bodies in text(); drop them so the
+    # page text matches what the keyword counts were tuned against
+    tree.strip_tags(["script", "style"])
+    return tree.root.text(separator="\n")
+
 def extract_street(card_addr: str | None, url_href: str) -> str:
     """Return street line without city/ZIP, e.g. '11628 N GALAHAD DR'."""
     if card_addr:
@@ -136,77 +272,60 @@ def extract_street(card_addr: str | None, url_href: str) -> str:
     if not m:
         return ""
     raw = m.group(1).replace("-", " ").upper()
-    raw = re.split(r"\sSPOKANE|\sWA\s", raw)[0]
-    raw = re.sub(r"\s\d{5}$", "", raw)
+    raw = SLUG_CITY_RE.split(raw)[0]
+    raw = SLUG_ZIP_RE.sub("", raw)
     return raw.strip()
 
-def extract_price_from_card(card) -> int:
-    """Extract price from Redfin property card."""
-    card_text = card.get_text()
-    
-    # Look for price patterns in the entire card text
-    price_patterns = [
-        r'\$([0-9,]+)\s*M',      # $1.5M format
-        r'\$([0-9,]+)\s*K',      # $450K format  
-        r'\$([0-9,]+(?:\.[0-9]+)?)\s*M',  # $1.25M format
-        r'\$([0-9,]+)',          # $450,000 format
-        r'([0-9,]+)\s*K',        # 450K format (no $)
-        r'([0-9,]+)'             # Raw numbers as last resort
-    ]
-    
-    for pattern in price_patterns:
-        matches = re.findall(pattern, card_text)
-        for match in matches:
-            try:
-                # Clean the match
-                price_str = match.replace(',', '').replace('$', '')
-                price_num = float(price_str)
-                
-                # Apply multipliers based on pattern
-                if 'M' in pattern:
-                    price_num *= 1000000
-                elif 'K' in pattern:
-                    price_num *= 1000
-                
-                # Only accept reasonable house prices (between $50K and $50M)
-                if 50000 <= price_num <= 50000000:
-                    price_int = int(price_num)
-                    # Trim rightmost digit as suggested - prices seem to have extra digit
-                    price_str = str(price_int)
-                    if len(price_str) > 5:  # Only trim if more than 5 digits
-                        price_int = int(price_str[:-1])  # Remove rightmost digit
-                    
-                    return price_int
-                    
-            except (ValueError, TypeError):
-                continue
+def extract_price_from_card(card_text: str) -> int:
+    """Extract price from Redfin property card text."""
+    # "$450,000", "$1.25M", "$450K" or "450K"; bare numbers (ZIPs, sqft) are ignored.
+    # Card text is run together ("$1.2M4 BD"), so the suffix is taken as-is and the
+    # plain dollar amount is the fallback when the scaled price is out of range.
+    for match in PRICE_RE.finditer(card_text):
+        dollar, amount, suffix = match.groups()
+        if not dollar and suffix != 'K':
+            continue
+        try:
+            value = float(amount.replace(',', ''))
+        except ValueError:  # bare ","
+            continue
+        
+        candidates = [value * PRICE_MULTIPLIERS[suffix]]
+        if dollar and suffix:
+            candidates.append(value)
+        for price_num in candidates:
+            # Only accept reasonable house prices (between $50K and $50M)
+            if 50000 <= price_num <= 50000000:
+                price_int = int(price_num)
+                # Trim rightmost digit as suggested - prices seem to have extra digit
+                if price_int > 99999:  # Only trim if more than 5 digits
+                    price_int //= 10
+                return price_int
     
     return 0
 
-def extract_lot_size_from_card(card) -> float:
-    """Extract lot size in acres from Redfin property card."""
-    # Look for lot size in various formats
-    card_text = card.get_text()
-    
+def extract_sqft_from_card(card_text: str) -> int:
+    """Extract living-area square footage from Redfin property card text."""
+    for match in SQFT_RE.finditer(card_text):
+        try:
+            return int(match.group(1).replace(',', ''))
+        except ValueError:  # bare "," before the unit
+            continue
+    return 0
+
+def extract_lot_size_from_card(card_text: str) -> float:
+    """Extract lot size in acres from Redfin property card text."""
     # Look for "X,XXX sq ft lot" or "X.X acres" patterns
-    lot_patterns = [
-        r'([\d,]+)\s*sq\s*ft\s*lot',
-        r'([\d.]+)\s*acres?\s*lot',
-        r'([\d.]+)\s*acres?(?:\s|$)',
-        r'Lot.*?([\d,]+)\s*sq.*?ft',
-        r'Lot.*?([\d.]+)\s*acres?'
-    ]
-    
-    for pattern in lot_patterns:
-        match = re.search(pattern, card_text, re.IGNORECASE)
+    for pattern, is_sqft in CARD_LOT_SIZE_PATTERNS:
+        match = pattern.search(card_text)
         if match:
             try:
                 value_str = match.group(1).replace(',', '')
                 value = float(value_str)
                 
                 # If it's square feet, convert to acres
-                if 'sq' in pattern or 'ft' in pattern:
-                    return round(value / 43560, 3)  # Convert sq ft to acres
+                if is_sqft:
+                    return round(value / SQFT_PER_ACRE, 3)  # Convert sq ft to acres
                 else:
                     return value  # Already in acres
             except ValueError:
@@ -214,10 +333,8 @@ def extract_lot_size_from_card(card) -> float:
     
     return 0.0
 
-def extract_post_date_from_card(card, show_raw_text=False) -> str:
-    """Extract post/listing date from Redfin property card with comprehensive debugging."""
-    card_text = card.get_text()
-    
+def extract_post_date_from_card(card_text: str, show_raw_text=False) -> str:
+    """Extract post/listing date from Redfin property card text with comprehensive debugging."""
     # Show full card text when debug flag is enabled
     if show_raw_text:
         print(f"\n{'='*50}")
@@ -228,150 +345,63 @@ def extract_post_date_from_card(card, show_raw_text=False) -> str:
         print(f"TEXT LENGTH: {len(card_text)} characters")
         print(f"{'='*50}\n")
     
+    now = dt.datetime.now()
+
     # Look for "days on Redfin" or "days on market" first - this is most reliable
-    days_patterns = [
-        r'(\d+)\s+days?\s+on\s+Redfin',        # "5 days on Redfin"
-        r'(\d+)\s+days?\s+on\s+market',        # "5 days on market"  
-        r'(\d+)\s+day\s+on\s+Redfin',          # "1 day on Redfin"
-        r'(\d+)\s+day\s+on\s+market',          # "1 day on market"
-        r'On\s+Redfin\s+(\d+)\s+days?',        # "On Redfin 5 days"
-        r'On\s+market\s+(\d+)\s+days?',        # "On market 5 days"
-    ]
-    
-    for pattern in days_patterns:
-        match = re.search(pattern, card_text, re.IGNORECASE)
-        if match:
-            try:
-                days_ago = int(match.group(1))
-                if 0 <= days_ago <= 365:  # Reasonable range
-                    post_date = dt.datetime.now() - dt.timedelta(days=days_ago)
-                    result = post_date.strftime('%m/%d/%Y')
-                    logging.info("Found days pattern: %s -> %d days ago -> %s", match.group(0), days_ago, result)
-                    return result
-            except (ValueError, TypeError):
-                continue
-    
-    # Look for status badges like "NEW TODAY", "NEW 2 HOURS AGO" etc. 
-    # These are common on Redfin - be aggressive to catch edge cases
-    status_patterns = [
-        r'NEW\s+TODAY',                         # "NEW TODAY"
-        r'NEW\s+(\d+)\s+HOURS?\s+AGO',         # "NEW 2 HOURS AGO"
-        r'NEW\s+(\d+)\s+HRS?\s+AGO',           # "NEW 2 HRS AGO"  
-        r'NEW\s+(\d+)\s+HOUR\s+AGO',           # "NEW 1 HOUR AGO"
-        r'NEW\s+(\d+)\s+MINUTES?\s+AGO',       # "NEW 30 MINUTES AGO"
-        r'NEW\s+(\d+)\s+MINS?\s+AGO',          # "NEW 30 MINS AGO"
-        r'NEW\s+(\d+)\s+MIN\s+AGO',            # "NEW 6 MIN AGO"
-        r'NEW\s+(\d+)\s+DAYS?\s+AGO',          # "NEW 3 DAYS AGO"
-        r'NEW\s+(\d+)\s+DAY\s+AGO',            # "NEW 1 DAY AGO"
-        r'NEW\s+YESTERDAY',                     # "NEW YESTERDAY"
-        r'NEW\s+A\s+FEW\s+MINUTES?\s+AGO',     # "NEW A FEW MINUTES AGO"
-        r'LISTED\s+TODAY',                      # "LISTED TODAY"
-        r'LISTED\s+(\d+)\s+DAYS?\s+AGO',       # "LISTED 2 DAYS AGO"
-        r'LISTED\s+YESTERDAY',                  # "LISTED YESTERDAY"
-        r'JUST\s+LISTED',                       # "JUST LISTED" 
-        r'RECENTLY\s+LISTED',                   # "RECENTLY LISTED"
-    ]
-    
-    for pattern in status_patterns:
-        match = re.search(pattern, card_text, re.IGNORECASE)
-        if match:
-            try:
-                now = dt.datetime.now()
-                matched_text = match.group(0)
-                
-                if 'TODAY' in matched_text.upper():
-                    result = now.strftime('%m/%d/%Y')
-                    logging.info("Found status pattern: %s -> today -> %s", matched_text, result)
-                    return result
-                elif 'YESTERDAY' in matched_text.upper():
-                    result = (now - dt.timedelta(days=1)).strftime('%m/%d/%Y')
-                    logging.debug("Found status pattern: %s -> yesterday -> %s", matched_text, result)
-                    return result
-                elif 'JUST LISTED' in matched_text.upper() or 'RECENTLY LISTED' in matched_text.upper() or 'A FEW MINUTES' in matched_text.upper():
-                    result = now.strftime('%m/%d/%Y')
-                    logging.debug("Found status pattern: %s -> today -> %s", matched_text, result)
-                    return result
-                elif match.groups():
-                    time_value = int(match.group(1))
-                    if 'HOUR' in matched_text.upper() or 'HR' in matched_text.upper():
-                        if time_value <= 24:  # Same day
-                            result = now.strftime('%m/%d/%Y')
-                            logging.debug("Found status pattern: %s -> %d hours ago (same day) -> %s", matched_text, time_value, result)
-                            return result
-                    elif 'MIN' in matched_text.upper():
-                        result = now.strftime('%m/%d/%Y')  # Same day
-                        logging.debug("Found status pattern: %s -> %d minutes ago (same day) -> %s", matched_text, time_value, result)
-                        return result
-                    elif 'DAY' in matched_text.upper():
-                        if time_value <= 30:  # Reasonable range
-                            post_date = now - dt.timedelta(days=time_value)
-                            result = post_date.strftime('%m/%d/%Y')
-                            logging.debug("Found status pattern: %s -> %d days ago -> %s", matched_text, time_value, result)
-                            return result
-            except (ValueError, TypeError, IndexError):
-                continue
-    
-    # Look for explicit dates in various formats
-    explicit_date_patterns = [
-        r'Listed\s+(\d{1,2}/\d{1,2}/\d{4})',         # "Listed 12/25/2024"
-        r'Posted\s+(\d{1,2}/\d{1,2}/\d{4})',         # "Posted 12/25/2024"
-        r'Added\s+(\d{1,2}/\d{1,2}/\d{4})',          # "Added 12/25/2024"
-        r'(\d{1,2}/\d{1,2}/\d{4})',                  # Just "12/25/2024"
-        r'(\d{1,2}-\d{1,2}-\d{4})',                  # "12-25-2024"
-        r'(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+(\d{1,2}),?\s+(\d{4})',  # "Dec 25, 2024"
-    ]
-    
-    for pattern in explicit_date_patterns:
-        match = re.search(pattern, card_text, re.IGNORECASE)
-        if match:
-            try:
-                if len(match.groups()) == 1:
-                    date_str = match.group(1)
-                    # Try different date formats
-                    for date_format in ['%m/%d/%Y', '%m-%d-%Y', '%Y-%m-%d']:
-                        try:
-                            parsed_date = dt.datetime.strptime(date_str, date_format)
-                            # Only accept dates from the past year
-                            if (dt.datetime.now() - parsed_date).days <= 365 and parsed_date <= dt.datetime.now():
-                                result = parsed_date.strftime('%m/%d/%Y')
-                                logging.debug("Found explicit date: %s -> %s", date_str, result)
-                                return result
-                        except ValueError:
-                            continue
-                elif len(match.groups()) == 3:
-                    # Month name format
-                    month_name, day, year = match.groups()
-                    month_names = ['JAN', 'FEB', 'MAR', 'APR', 'MAY', 'JUN',
-                                 'JUL', 'AUG', 'SEP', 'OCT', 'NOV', 'DEC']
-                    try:
-                        month_num = month_names.index(month_name.upper()) + 1
-                        parsed_date = dt.datetime(int(year), month_num, int(day))
-                        if (dt.datetime.now() - parsed_date).days <= 365 and parsed_date <= dt.datetime.now():
-                            result = parsed_date.strftime('%m/%d/%Y')
-                            logging.debug("Found month name date: %s %s %s -> %s", month_name, day, year, result)
-                            return result
-                    except (ValueError, IndexError):
-                        continue
-            except (ValueError, TypeError, IndexError):
+    for match in DAYS_ON_RE.finditer(card_text):
+        days_ago = int(match.group(1) or match.group(2))
+        if 0 <= days_ago <= 365:  # Reasonable range
+            result = (now - dt.timedelta(days=days_ago)).strftime('%m/%d/%Y')
+            logging.info("Found days pattern: %s -> %d days ago -> %s", match.group(0), days_ago, result)
+            return result
+
+    # Look for status badges like "NEW TODAY", "NEW 2 HOURS AGO", "JUST LISTED" etc.
+    for match in STATUS_BADGE_RE.finditer(card_text):
+        matched_text = match.group(0)
+        word = match.group(1)
+        amount = match.group(2) or match.group(4)
+        unit = match.group(3) or match.group(5)
+        if amount is None:
+            # TODAY / YESTERDAY / A FEW MINUTES AGO / JUST LISTED / RECENTLY LISTED
+            days_ago = 1 if word and word.upper() == 'YESTERDAY' else 0
+        else:
+            days_ago = int(amount)
+            unit = unit[0].upper()
+            if unit == 'H':
+                if days_ago > 24:
+                    continue
+                days_ago = 0  # Same day
+            elif unit == 'M':
+                days_ago = 0  # Same day
+            elif days_ago > 30:  # Reasonable range for DAYS
                 continue
-    
-    # Last resort: Look for any time indicators that suggest recency
-    recency_indicators = [
-        r'\bNEW\b',
-        r'\bJUST\s+LISTED\b',
-        r'\bRECENTLY\s+LISTED\b',
-        r'\bFRESH\s+LISTING\b',
-        r'\bPRICE\s+IMPROVEMENT\b',
-        r'\bPRICE\s+REDUCED\b',
-        r'\bBACK\s+ON\s+MARKET\b'
-    ]
-    
-    for pattern in recency_indicators:
-        if re.search(pattern, card_text, re.IGNORECASE):
-            result = dt.datetime.now().strftime('%m/%d/%Y')
-            logging.debug("Found recency indicator: %s -> today -> %s", pattern, result)
+        result = (now - dt.timedelta(days=days_ago)).strftime('%m/%d/%Y')
+        logging.debug("Found status pattern: %s -> %d days ago -> %s", matched_text, days_ago, result)
+        return result
+
+    # Look for explicit dates like "12/25/2024", "12-25-2024" or "Dec 25, 2024"
+    for match in EXPLICIT_DATE_RE.finditer(card_text):
+        numeric, month_name, day, year = match.groups()
+        try:
+            if numeric:
+                parsed_date = dt.datetime.strptime(numeric.replace('-', '/'), '%m/%d/%Y')
+            else:
+                parsed_date = dt.datetime(int(year), MONTHS[month_name.upper()], int(day))
+        except ValueError:
+            continue
+        # Only accept dates from the past year
+        if (now - parsed_date).days <= 365 and parsed_date <= now:
+            result = parsed_date.strftime('%m/%d/%Y')
+            logging.debug("Found explicit date: %s -> %s", match.group(0), result)
             return result
-    
+
+    # Last resort: Look for any time indicators that suggest recency
+    match = RECENCY_RE.search(card_text)
+    if match:
+        result = now.strftime('%m/%d/%Y')
+        logging.debug("Found recency indicator: %s -> today -> %s", match.group(0), result)
+        return result
+
     # DEBUGGING: Log when we fall back to unknown  
     logging.debug("No date pattern matched for property. This is normal for older listings.")
     logging.debug("Card text length: %d characters", len(card_text))
@@ -384,12 +414,12 @@ def clean_date_string(date_str: str) -> str:
     
     # Remove common unwanted characters
     cleaned = date_str.strip()
-    cleaned = re.sub(r'[^\d/\-]', '', cleaned)  # Keep only digits, /, and -
+    cleaned = DATE_JUNK_RE.sub('', cleaned)  # Keep only digits, /, and -
     
     # Validate the format
-    if re.match(r'^\d{1,2}/\d{1,2}/\d{4}$', cleaned):
+    if SLASH_DATE_RE.fullmatch(cleaned):
         return cleaned
-    elif re.match(r'^\d{1,2}-\d{1,2}-\d{4}$', cleaned):
+    elif DASH_DATE_RE.fullmatch(cleaned):
         # Convert to MM/DD/YYYY format
         try:
             parsed = dt.datetime.strptime(cleaned, '%m-%d-%Y')
@@ -399,24 +429,47 @@ def clean_date_string(date_str: str) -> str:
     
     return "Unknown"
 
-def extract_bedrooms_from_card(card) -> int:
-    """Extract number of bedrooms from Redfin property card."""
-    card_text = card.get_text()
+def compile_words(labels: tuple[str, ...]) -> tuple[re.Pattern, list[tuple[str, re.Pattern]]]:
+    """Compile case-insensitive whole-word matchers for labels, plus one alternation of them all.
     
+    The alternation lets find_words/first_word reject a card that mentions none of the
+    labels in a single scan instead of one search per label.
+    """
+    any_word = re.compile(r'\b(?:%s)\b' % '|'.join(map(re.escape, labels)), re.IGNORECASE)
+    return any_word, [(label, re.compile(rf'\b{re.escape(label)}\b', re.IGNORECASE)) for label in labels]
+
+def find_words(card_text: str, words: tuple[re.Pattern, list[tuple[str, re.Pattern]]]) -> list[str]:
+    """Return every label from compile_words found in the card text, in label order."""
+    any_word, labels = words
+    if not any_word.search(card_text):
+        return []
+    return [label for label, word_re in labels if word_re.search(card_text)]
+
+def first_word(card_text: str, words: tuple[re.Pattern, list[tuple[str, re.Pattern]]]) -> str | None:
+    """Return the first label (in label order) from compile_words found in the card text."""
+    any_word, labels = words
+    if any_word.search(card_text):
+        for label, word_re in labels:
+            if word_re.search(card_text):
+                return label
+    return None
+
+CARD_BEDROOM_PATTERNS = [re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'(\d+)\s*beds?\b',           # "3 beds" or "3 bed"
+    r'(\d+)\s*BD\b',              # "3 BD"
+    r'(\d+)\s*BR\b',              # "3 BR"
+    r'(\d+)\s*BDRM\b',            # "3 BDRM"
+    r'(\d+)\s*bedroom\b',         # "3 bedroom"
+    r'(\d+)\s*bedrooms?\b',       # "3 bedrooms"
+    r'Beds:?\s*(\d+)',            # "Beds: 3"
+    r'Bedrooms:?\s*(\d+)',        # "Bedrooms: 3"
+)]
+
+def extract_bedrooms_from_card(card_text: str) -> int:
+    """Extract number of bedrooms from Redfin property card text."""
     # Look for bedroom patterns
-    bedroom_patterns = [
-        r'(\d+)\s*beds?\b',           # "3 beds" or "3 bed"
-        r'(\d+)\s*BD\b',              # "3 BD"
-        r'(\d+)\s*BR\b',              # "3 BR"
-        r'(\d+)\s*BDRM\b',            # "3 BDRM"
-        r'(\d+)\s*bedroom\b',         # "3 bedroom"
-        r'(\d+)\s*bedrooms?\b',       # "3 bedrooms"
-        r'Beds:?\s*(\d+)',            # "Beds: 3"
-        r'Bedrooms:?\s*(\d+)',        # "Bedrooms: 3"
-    ]
-    
-    for pattern in bedroom_patterns:
-        match = re.search(pattern, card_text, re.IGNORECASE)
+    for pattern in CARD_BEDROOM_PATTERNS:
+        match = pattern.search(card_text)
         if match:
             try:
                 beds = int(match.group(1))
@@ -428,22 +481,20 @@ def extract_bedrooms_from_card(card) -> int:
     
     return 0
 
-def extract_bathrooms_from_card(card) -> float:
-    """Extract number of bathrooms from Redfin property card."""
-    card_text = card.get_text()
-    
+CARD_BATHROOM_PATTERNS = [re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'(\d+\.?\d*)\s*baths?\b',       # "2.5 baths" or "2 bath"
+    r'(\d+\.?\d*)\s*BA\b',           # "2.5 BA"
+    r'(\d+\.?\d*)\s*bathroom\b',     # "2 bathroom"
+    r'(\d+\.?\d*)\s*bathrooms?\b',   # "2.5 bathrooms"
+    r'Baths:?\s*(\d+\.?\d*)',        # "Baths: 2.5"
+    r'Bathrooms:?\s*(\d+\.?\d*)',    # "Bathrooms: 2.5"
+)]
+
+def extract_bathrooms_from_card(card_text: str) -> float:
+    """Extract number of bathrooms from Redfin property card text."""
     # Look for bathroom patterns
-    bathroom_patterns = [
-        r'(\d+\.?\d*)\s*baths?\b',       # "2.5 baths" or "2 bath"
-        r'(\d+\.?\d*)\s*BA\b',           # "2.5 BA"
-        r'(\d+\.?\d*)\s*bathroom\b',     # "2 bathroom"
-        r'(\d+\.?\d*)\s*bathrooms?\b',   # "2.5 bathrooms"
-        r'Baths:?\s*(\d+\.?\d*)',        # "Baths: 2.5"
-        r'Bathrooms:?\s*(\d+\.?\d*)',    # "Bathrooms: 2.5"
-    ]
-    
-    for pattern in bathroom_patterns:
-        match = re.search(pattern, card_text, re.IGNORECASE)
+    for pattern in CARD_BATHROOM_PATTERNS:
+        match = pattern.search(card_text)
         if match:
             try:
                 baths = float(match.group(1))
@@ -455,90 +506,85 @@ def extract_bathrooms_from_card(card) -> float:
     
     return 0.0
 
-def extract_property_type_from_card(card) -> str:
-    """Extract property type from Redfin property card."""
-    card_text = card.get_text()
-    
-    # Look for property type patterns
-    property_types = [
-        'Single Family',
-        'Single-Family',
-        'Townhouse',
-        'Townhome',
-        'Condo',
-        'Condominium',
-        'Multi-Family',
-        'Duplex',
-        'Triplex',
-        'Fourplex',
-        'Apartment',
-        'Mobile Home',
-        'Manufactured Home',
-        'Vacant Land',
-        'Land',
-        'Commercial'
-    ]
-    
+CARD_PROPERTY_TYPES = compile_words((
+    'Single Family',
+    'Single-Family',
+    'Townhouse',
+    'Townhome',
+    'Condo',
+    'Condominium',
+    'Multi-Family',
+    'Duplex',
+    'Triplex',
+    'Fourplex',
+    'Apartment',
+    'Mobile Home',
+    'Manufactured Home',
+    'Vacant Land',
+    'Land',
+    'Commercial'
+))
+
+CARD_GENERIC_HOME_PATTERNS = [re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'House\b',
+    r'Home\b',
+    r'Residence\b'
+)]
+
+def extract_property_type_from_card(card_text: str) -> str:
+    """Extract property type from Redfin property card text."""
     # Check for each property type
-    for prop_type in property_types:
-        if re.search(rf'\b{re.escape(prop_type)}\b', card_text, re.IGNORECASE):
-            return prop_type
+    found = first_word(card_text, CARD_PROPERTY_TYPES)
+    if found:
+        return found
     
     # Look for generic patterns
-    generic_patterns = [
-        r'House\b',
-        r'Home\b',
-        r'Residence\b'
-    ]
-    
-    for pattern in generic_patterns:
-        if re.search(pattern, card_text, re.IGNORECASE):
+    for pattern in CARD_GENERIC_HOME_PATTERNS:
+        if pattern.search(card_text):
             return 'Single Family'  # Default assumption
     
     return 'Unknown'
 
-def extract_year_built_from_card(card) -> int:
-    """Extract year built from Redfin property card."""
-    card_text = card.get_text()
+CARD_YEAR_PATTERNS = [re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'Built in (\d{4})',          # "Built in 1995"
+    r'Built:?\s*(\d{4})',         # "Built: 1995"
+    r'Year Built:?\s*(\d{4})',    # "Year Built: 1995"
+    r'(\d{4})\s*Built',           # "1995 Built"
+    r'Yr Built:?\s*(\d{4})',      # "Yr Built: 1995"
+)]
+
+def extract_year_built_from_card(card_text: str) -> int:
+    """Extract year built from Redfin property card text."""
+    # Sanity range upper bound, allowing for new construction; read the clock once per card
+    max_year = dt.date.today().year + 5
     
     # Look for year built patterns
-    year_patterns = [
-        r'Built in (\d{4})',          # "Built in 1995"
-        r'Built:?\s*(\d{4})',         # "Built: 1995"
-        r'Year Built:?\s*(\d{4})',    # "Year Built: 1995"
-        r'(\d{4})\s*Built',           # "1995 Built"
-        r'Yr Built:?\s*(\d{4})',      # "Yr Built: 1995"
-    ]
-    
-    for pattern in year_patterns:
-        match = re.search(pattern, card_text, re.IGNORECASE)
+    for pattern in CARD_YEAR_PATTERNS:
+        match = pattern.search(card_text)
         if match:
             try:
                 year = int(match.group(1))
                 # Sanity check - reasonable year range
-                current_year = dt.datetime.now().year
-                if 1800 <= year <= current_year + 5:  # Allow for new construction
+                if 1800 <= year <= max_year:
                     return year
             except (ValueError, TypeError):
                 continue
     
     return 0
 
-def extract_days_on_market_from_card(card) -> int:
-    """Extract days on market from Redfin property card."""
-    card_text = card.get_text()
-    
+CARD_DOM_PATTERNS = [re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'(\d+)\s*days?\s*on\s*Redfin',    # "5 days on Redfin"
+    r'(\d+)\s*days?\s*on\s*market',    # "5 days on market"
+    r'(\d+)\s*DOM\b',                  # "5 DOM"
+    r'On market:?\s*(\d+)\s*days?',    # "On market: 5 days"
+    r'Days on market:?\s*(\d+)',       # "Days on market: 5"
+)]
+
+def extract_days_on_market_from_card(card_text: str) -> int:
+    """Extract days on market from Redfin property card text."""
     # Look for days on market patterns
-    dom_patterns = [
-        r'(\d+)\s*days?\s*on\s*Redfin',    # "5 days on Redfin"
-        r'(\d+)\s*days?\s*on\s*market',    # "5 days on market"
-        r'(\d+)\s*DOM\b',                  # "5 DOM"
-        r'On market:?\s*(\d+)\s*days?',    # "On market: 5 days"
-        r'Days on market:?\s*(\d+)',       # "Days on market: 5"
-    ]
-    
-    for pattern in dom_patterns:
-        match = re.search(pattern, card_text, re.IGNORECASE)
+    for pattern in CARD_DOM_PATTERNS:
+        match = pattern.search(card_text)
         if match:
             try:
                 days = int(match.group(1))
@@ -550,30 +596,38 @@ def extract_days_on_market_from_card(card) -> int:
     
     return 0
 
-def extract_garage_parking_from_card(card) -> str:
-    """Extract garage/parking information from Redfin property card."""
-    card_text = card.get_text()
-    
+CARD_GARAGE_PATTERNS = [re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'(\d+)\s*-?\s*car\s*garage',      # "2-car garage" or "2 car garage"
+    r'(\d+)\s*garage',                 # "2 garage"
+    r'garage:?\s*(\d+)',               # "Garage: 2"
+    r'(\d+)\s*bay\s*garage',           # "2 bay garage"
+    r'(\d+)\s*stall\s*garage',         # "2 stall garage"
+    r'parking:?\s*(\d+)',              # "Parking: 2"
+    r'(\d+)\s*parking\s*spaces?',      # "2 parking spaces"
+    r'(\d+)\s*spaces?',                # "2 spaces"
+)]
+
+CARD_PARKING_INDICATORS = compile_words((
+    'Attached Garage',
+    'Detached Garage',
+    'Carport',
+    'Covered Parking',
+    'No Garage',
+    'Garage Available',
+    'Parking Available'
+))
+
+def extract_garage_parking_from_card(card_text: str) -> str:
+    """Extract garage/parking information from Redfin property card text."""
     # Look for garage/parking patterns
-    garage_patterns = [
-        r'(\d+)\s*-?\s*car\s*garage',      # "2-car garage" or "2 car garage"
-        r'(\d+)\s*garage',                 # "2 garage"
-        r'garage:?\s*(\d+)',               # "Garage: 2"
-        r'(\d+)\s*bay\s*garage',           # "2 bay garage"
-        r'(\d+)\s*stall\s*garage',         # "2 stall garage"
-        r'parking:?\s*(\d+)',              # "Parking: 2"
-        r'(\d+)\s*parking\s*spaces?',      # "2 parking spaces"
-        r'(\d+)\s*spaces?',                # "2 spaces"
-    ]
-    
-    for pattern in garage_patterns:
-        match = re.search(pattern, card_text, re.IGNORECASE)
+    for pattern in CARD_GARAGE_PATTERNS:
+        match = pattern.search(card_text)
         if match:
             try:
                 spaces = int(match.group(1))
                 # Sanity check - reasonable parking count
                 if 0 <= spaces <= 20:
-                    if 'garage' in pattern:
+                    if 'garage' in pattern.pattern:
                         return f"{spaces}-car garage"
                     else:
                         return f"{spaces} parking spaces"
@@ -581,37 +635,25 @@ def extract_garage_parking_from_card(card) -> str:
                 continue
     
     # Look for text indicators
-    parking_indicators = [
-        'Attached Garage',
-        'Detached Garage',
-        'Carport',
-        'Covered Parking',
-        'No Garage',
-        'Garage Available',
-        'Parking Available'
-    ]
-    
-    for indicator in parking_indicators:
-        if re.search(rf'\b{re.escape(indicator)}\b', card_text, re.IGNORECASE):
-            return indicator
+    found = first_word(card_text, CARD_PARKING_INDICATORS)
+    if found:
+        return found
     
     return 'Unknown'
 
-def extract_mls_number_from_card(card) -> str:
-    """Extract MLS number from Redfin property card."""
-    card_text = card.get_text()
-    
+CARD_MLS_PATTERNS = [re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'MLS\s*#?\s*[:\-]?\s*([A-Z0-9]+)',      # "MLS #123456" or "MLS: 123456"
+    r'MLS\s*ID\s*[:\-]?\s*([A-Z0-9]+)',      # "MLS ID: 123456"
+    r'List\s*#\s*([A-Z0-9]+)',               # "List #123456"
+    r'Listing\s*#\s*([A-Z0-9]+)',            # "Listing #123456"
+    r'ID\s*[:\-]?\s*([A-Z0-9]{6,})',         # "ID: 123456"
+)]
+
+def extract_mls_number_from_card(card_text: str) -> str:
+    """Extract MLS number from Redfin property card text."""
     # Look for MLS patterns
-    mls_patterns = [
-        r'MLS\s*#?\s*[:\-]?\s*([A-Z0-9]+)',      # "MLS #123456" or "MLS: 123456"
-        r'MLS\s*ID\s*[:\-]?\s*([A-Z0-9]+)',      # "MLS ID: 123456"
-        r'List\s*#\s*([A-Z0-9]+)',               # "List #123456"
-        r'Listing\s*#\s*([A-Z0-9]+)',            # "Listing #123456"
-        r'ID\s*[:\-]?\s*([A-Z0-9]{6,})',         # "ID: 123456"
-    ]
-    
-    for pattern in mls_patterns:
-        match = re.search(pattern, card_text, re.IGNORECASE)
+    for pattern in CARD_MLS_PATTERNS:
+        match = pattern.search(card_text)
         if match:
             mls_id = match.group(1)
             if len(mls_id) >= 4:  # Reasonable MLS number length
@@ -619,21 +661,26 @@ def extract_mls_number_from_card(card) -> str:
     
     return 'Unknown'
 
-def extract_hoa_fee_from_card(card) -> str:
-    """Extract HOA fee from Redfin property card."""
-    card_text = card.get_text()
-    
+CARD_HOA_PATTERNS = [re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'HOA\s*[:\-]?\s*\$([0-9,]+)(?:/mo|/month)?',     # "HOA: $150/mo"
+    r'HOA\s*Fee\s*[:\-]?\s*\$([0-9,]+)',             # "HOA Fee: $150"
+    r'Association\s*Fee\s*[:\-]?\s*\$([0-9,]+)',      # "Association Fee: $150"
+    r'\$([0-9,]+)\s*HOA',                             # "$150 HOA"
+    r'HOA\s*[:\-]?\s*([0-9,]+)',                      # "HOA: 150"
+)]
+
+CARD_NO_HOA_PATTERNS = [re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'No\s*HOA',
+    r'HOA\s*None',
+    r'No\s*Association',
+    r'HOA\s*N/A'
+)]
+
+def extract_hoa_fee_from_card(card_text: str) -> str:
+    """Extract HOA fee from Redfin property card text."""
     # Look for HOA patterns
-    hoa_patterns = [
-        r'HOA\s*[:\-]?\s*\$([0-9,]+)(?:/mo|/month)?',     # "HOA: $150/mo"
-        r'HOA\s*Fee\s*[:\-]?\s*\$([0-9,]+)',             # "HOA Fee: $150"
-        r'Association\s*Fee\s*[:\-]?\s*\$([0-9,]+)',      # "Association Fee: $150"
-        r'\$([0-9,]+)\s*HOA',                             # "$150 HOA"
-        r'HOA\s*[:\-]?\s*([0-9,]+)',                      # "HOA: 150"
-    ]
-    
-    for pattern in hoa_patterns:
-        match = re.search(pattern, card_text, re.IGNORECASE)
+    for pattern in CARD_HOA_PATTERNS:
+        match = pattern.search(card_text)
         if match:
             try:
                 fee = match.group(1).replace(',', '')
@@ -644,34 +691,25 @@ def extract_hoa_fee_from_card(card) -> str:
                 continue
     
     # Look for "No HOA" indicators
-    no_hoa_patterns = [
-        r'No\s*HOA',
-        r'HOA\s*None',
-        r'No\s*Association',
-        r'HOA\s*N/A'
-    ]
-    
-    for pattern in no_hoa_patterns:
-        if re.search(pattern, card_text, re.IGNORECASE):
+    for pattern in CARD_NO_HOA_PATTERNS:
+        if pattern.search(card_text):
             return 'No HOA'
     
     return 'Unknown'
 
-def extract_property_taxes_from_card(card) -> str:
-    """Extract property tax information from Redfin property card."""
-    card_text = card.get_text()
-    
+CARD_TAX_PATTERNS = [re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'Property\s*Tax\s*[:\-]?\s*\$([0-9,]+)(?:/yr|/year)?',    # "Property Tax: $3,500/yr"
+    r'Tax\s*[:\-]?\s*\$([0-9,]+)(?:/yr|/year)?',              # "Tax: $3,500/yr"
+    r'Annual\s*Tax\s*[:\-]?\s*\$([0-9,]+)',                   # "Annual Tax: $3,500"
+    r'Taxes\s*[:\-]?\s*\$([0-9,]+)',                          # "Taxes: $3,500"
+    r'\$([0-9,]+)\s*(?:property\s*)?tax',                     # "$3,500 property tax"
+)]
+
+def extract_property_taxes_from_card(card_text: str) -> str:
+    """Extract property tax information from Redfin property card text."""
     # Look for property tax patterns
-    tax_patterns = [
-        r'Property\s*Tax\s*[:\-]?\s*\$([0-9,]+)(?:/yr|/year)?',    # "Property Tax: $3,500/yr"
-        r'Tax\s*[:\-]?\s*\$([0-9,]+)(?:/yr|/year)?',              # "Tax: $3,500/yr"
-        r'Annual\s*Tax\s*[:\-]?\s*\$([0-9,]+)',                   # "Annual Tax: $3,500"
-        r'Taxes\s*[:\-]?\s*\$([0-9,]+)',                          # "Taxes: $3,500"
-        r'\$([0-9,]+)\s*(?:property\s*)?tax',                     # "$3,500 property tax"
-    ]
-    
-    for pattern in tax_patterns:
-        match = re.search(pattern, card_text, re.IGNORECASE)
+    for pattern in CARD_TAX_PATTERNS:
+        match = pattern.search(card_text)
         if match:
             try:
                 tax_str = match.group(1).replace(',', '')
@@ -683,22 +721,29 @@ def extract_property_taxes_from_card(card) -> str:
     
     return 'Unknown'
 
-def extract_stories_from_card(card) -> str:
-    """Extract number of stories from Redfin property card."""
-    card_text = card.get_text()
-    
+CARD_STORY_PATTERNS = [re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'(\d+)\s*Story',                    # "2 Story"
+    r'(\d+)\s*Stories',                  # "2 Stories"
+    r'(\d+)\s*Level',                    # "2 Level"
+    r'(\d+)\s*Levels',                   # "2 Levels"
+    r'Stories?\s*[:\-]?\s*(\d+)',        # "Stories: 2"
+    r'Levels?\s*[:\-]?\s*(\d+)',         # "Levels: 2"
+)]
+
+CARD_STORY_INDICATORS = compile_words((
+    'Single Story',
+    'One Story',
+    'Two Story',
+    'Multi-Level',
+    'Split Level',
+    'Tri-Level'
+))
+
+def extract_stories_from_card(card_text: str) -> str:
+    """Extract number of stories from Redfin property card text."""
     # Look for story patterns
-    story_patterns = [
-        r'(\d+)\s*Story',                    # "2 Story"
-        r'(\d+)\s*Stories',                  # "2 Stories"
-        r'(\d+)\s*Level',                    # "2 Level"
-        r'(\d+)\s*Levels',                   # "2 Levels"
-        r'Stories?\s*[:\-]?\s*(\d+)',        # "Stories: 2"
-        r'Levels?\s*[:\-]?\s*(\d+)',         # "Levels: 2"
-    ]
-    
-    for pattern in story_patterns:
-        match = re.search(pattern, card_text, re.IGNORECASE)
+    for pattern in CARD_STORY_PATTERNS:
+        match = pattern.search(card_text)
         if match:
             try:
                 stories = int(match.group(1))
@@ -708,161 +753,144 @@ def extract_stories_from_card(card) -> str:
                 continue
     
     # Look for text indicators
-    story_indicators = [
-        'Single Story',
-        'One Story',
-        'Two Story',
-        'Multi-Level',
-        'Split Level',
-        'Tri-Level'
-    ]
-    
-    for indicator in story_indicators:
-        if re.search(rf'\b{re.escape(indicator)}\b', card_text, re.IGNORECASE):
-            return indicator
+    found = first_word(card_text, CARD_STORY_INDICATORS)
+    if found:
+        return found
     
     return 'Unknown'
 
-def extract_basement_from_card(card) -> str:
-    """Extract basement information from Redfin property card."""
-    card_text = card.get_text()
-    
+CARD_BASEMENT_PATTERNS = compile_words((
+    'Finished Basement',
+    'Unfinished Basement',
+    'Partial Basement',
+    'Full Basement',
+    'Walkout Basement',
+    'Daylight Basement',
+    'Basement'
+))
+
+CARD_NO_BASEMENT_PATTERNS = compile_words((
+    'No Basement',
+    'Slab Foundation',
+    'Crawl Space'
+))
+
+def extract_basement_from_card(card_text: str) -> str:
+    """Extract basement information from Redfin property card text."""
     # Look for basement patterns
-    basement_patterns = [
-        'Finished Basement',
-        'Unfinished Basement',
-        'Partial Basement',
-        'Full Basement',
-        'Walkout Basement',
-        'Daylight Basement',
-        'Basement'
-    ]
-    
-    for pattern in basement_patterns:
-        if re.search(rf'\b{re.escape(pattern)}\b', card_text, re.IGNORECASE):
-            return pattern
+    found = first_word(card_text, CARD_BASEMENT_PATTERNS)
+    if found:
+        return found
     
     # Look for "No Basement" indicators
-    no_basement_patterns = [
-        'No Basement',
-        'Slab Foundation',
-        'Crawl Space'
-    ]
-    
-    for pattern in no_basement_patterns:
-        if re.search(rf'\b{re.escape(pattern)}\b', card_text, re.IGNORECASE):
-            return pattern
+    found = first_word(card_text, CARD_NO_BASEMENT_PATTERNS)
+    if found:
+        return found
     
     return 'Unknown'
 
-def extract_heating_cooling_from_card(card) -> str:
+CARD_HVAC_PATTERNS = compile_words((
+    'Central Air',
+    'Forced Air',
+    'Heat Pump',
+    'Radiant Heat',
+    'Baseboard Heat',
+    'Geothermal',
+    'Electric Heat',
+    'Gas Heat',
+    'Oil Heat',
+    'Solar Heat',
+    'AC',
+    'A/C',
+    'Air Conditioning',
+    'Heating',
+    'Cooling'
+))
+
+def extract_heating_cooling_from_card(card_text: str) -> str:
     """Extract heating and cooling system information."""
-    card_text = card.get_text()
-    
     # Look for HVAC patterns
-    hvac_patterns = [
-        'Central Air',
-        'Forced Air',
-        'Heat Pump',
-        'Radiant Heat',
-        'Baseboard Heat',
-        'Geothermal',
-        'Electric Heat',
-        'Gas Heat',
-        'Oil Heat',
-        'Solar Heat',
-        'AC',
-        'A/C',
-        'Air Conditioning',
-        'Heating',
-        'Cooling'
-    ]
-    
-    found_systems = []
-    for pattern in hvac_patterns:
-        if re.search(rf'\b{re.escape(pattern)}\b', card_text, re.IGNORECASE):
-            found_systems.append(pattern)
+    found_systems = find_words(card_text, CARD_HVAC_PATTERNS)
     
     if found_systems:
         return ', '.join(found_systems[:3])  # Limit to first 3 to avoid clutter
     
     return 'Unknown'
 
-def extract_flooring_from_card(card) -> str:
-    """Extract flooring information from Redfin property card."""
-    card_text = card.get_text()
-    
+CARD_FLOORING_PATTERNS = compile_words((
+    'Hardwood',
+    'Laminate',
+    'Vinyl',
+    'Carpet',
+    'Tile',
+    'Stone',
+    'Concrete',
+    'Bamboo',
+    'Cork',
+    'Linoleum',
+    'Marble',
+    'Granite',
+    'Engineered Wood'
+))
+
+def extract_flooring_from_card(card_text: str) -> str:
+    """Extract flooring information from Redfin property card text."""
     # Look for flooring patterns
-    flooring_patterns = [
-        'Hardwood',
-        'Laminate',
-        'Vinyl',
-        'Carpet',
-        'Tile',
-        'Stone',
-        'Concrete',
-        'Bamboo',
-        'Cork',
-        'Linoleum',
-        'Marble',
-        'Granite',
-        'Engineered Wood'
-    ]
-    
-    found_flooring = []
-    for pattern in flooring_patterns:
-        if re.search(rf'\b{re.escape(pattern)}\b', card_text, re.IGNORECASE):
-            found_flooring.append(pattern)
+    found_flooring = find_words(card_text, CARD_FLOORING_PATTERNS)
     
     if found_flooring:
         return ', '.join(found_flooring[:3])  # Limit to first 3
     
     return 'Unknown'
 
-def extract_appliances_from_card(card) -> str:
-    """Extract appliances information from Redfin property card."""
-    card_text = card.get_text()
-    
+CARD_APPLIANCE_PATTERNS = compile_words((
+    'Refrigerator',
+    'Dishwasher',
+    'Washer',
+    'Dryer',
+    'Microwave',
+    'Oven',
+    'Stove',
+    'Range',
+    'Disposal',
+    'Freezer',
+    'Wine Cooler',
+    'All Appliances'
+))
+
+def extract_appliances_from_card(card_text: str) -> str:
+    """Extract appliances information from Redfin property card text."""
     # Look for appliance patterns
-    appliance_patterns = [
-        'Refrigerator',
-        'Dishwasher',
-        'Washer',
-        'Dryer',
-        'Microwave',
-        'Oven',
-        'Stove',
-        'Range',
-        'Disposal',
-        'Freezer',
-        'Wine Cooler',
-        'All Appliances'
-    ]
-    
-    found_appliances = []
-    for pattern in appliance_patterns:
-        if re.search(rf'\b{re.escape(pattern)}\b', card_text, re.IGNORECASE):
-            found_appliances.append(pattern)
+    found_appliances = find_words(card_text, CARD_APPLIANCE_PATTERNS)
     
     if found_appliances:
         return ', '.join(found_appliances[:4])  # Limit to first 4
     
     return 'Unknown'
 
-def extract_fireplace_from_card(card) -> str:
-    """Extract fireplace information from Redfin property card."""
-    card_text = card.get_text()
-    
+CARD_FIREPLACE_PATTERNS = [re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'(\d+)\s*Fireplace',                # "2 Fireplace"
+    r'(\d+)\s*Fireplaces',               # "2 Fireplaces"
+    r'Fireplace\s*[:\-]?\s*(\d+)',       # "Fireplace: 2"
+    r'Fireplaces\s*[:\-]?\s*(\d+)',      # "Fireplaces: 2"
+)]
+
+CARD_FIREPLACE_TYPES = compile_words((
+    'Wood Fireplace',
+    'Gas Fireplace',
+    'Electric Fireplace',
+    'Fireplace',
+    'Wood Burning',
+    'Gas Burning'
+))
+
+CARD_NO_FIREPLACE_RE = re.compile(r'No\s*Fireplace', re.IGNORECASE)
+
+def extract_fireplace_from_card(card_text: str) -> str:
+    """Extract fireplace information from Redfin property card text."""
     # Look for fireplace patterns
-    fireplace_patterns = [
-        r'(\d+)\s*Fireplace',                # "2 Fireplace"
-        r'(\d+)\s*Fireplaces',               # "2 Fireplaces"
-        r'Fireplace\s*[:\-]?\s*(\d+)',       # "Fireplace: 2"
-        r'Fireplaces\s*[:\-]?\s*(\d+)',      # "Fireplaces: 2"
-    ]
-    
-    for pattern in fireplace_patterns:
-        match = re.search(pattern, card_text, re.IGNORECASE)
+    for pattern in CARD_FIREPLACE_PATTERNS:
+        match = pattern.search(card_text)
         if match:
             try:
                 count = int(match.group(1))
@@ -872,146 +900,123 @@ def extract_fireplace_from_card(card) -> str:
                 continue
     
     # Look for fireplace types
-    fireplace_types = [
-        'Wood Fireplace',
-        'Gas Fireplace',
-        'Electric Fireplace',
-        'Fireplace',
-        'Wood Burning',
-        'Gas Burning'
-    ]
-    
-    for ftype in fireplace_types:
-        if re.search(rf'\b{re.escape(ftype)}\b', card_text, re.IGNORECASE):
-            return ftype
+    found = first_word(card_text, CARD_FIREPLACE_TYPES)
+    if found:
+        return found
     
     # Look for "No Fireplace"
-    if re.search(r'No\s*Fireplace', card_text, re.IGNORECASE):
+    if CARD_NO_FIREPLACE_RE.search(card_text):
         return 'No Fireplace'
     
     return 'Unknown'
 
-def extract_pool_spa_from_card(card) -> str:
-    """Extract pool and spa information from Redfin property card."""
-    card_text = card.get_text()
-    
+CARD_POOL_SPA_PATTERNS = compile_words((
+    'Swimming Pool',
+    'Pool',
+    'Spa',
+    'Hot Tub',
+    'Jacuzzi',
+    'In-Ground Pool',
+    'Above Ground Pool',
+    'Heated Pool',
+    'Saltwater Pool'
+))
+
+def extract_pool_spa_from_card(card_text: str) -> str:
+    """Extract pool and spa information from Redfin property card text."""
     # Look for pool/spa patterns
-    pool_spa_patterns = [
-        'Swimming Pool',
-        'Pool',
-        'Spa',
-        'Hot Tub',
-        'Jacuzzi',
-        'In-Ground Pool',
-        'Above Ground Pool',
-        'Heated Pool',
-        'Saltwater Pool'
-    ]
-    
-    found_features = []
-    for pattern in pool_spa_patterns:
-        if re.search(rf'\b{re.escape(pattern)}\b', card_text, re.IGNORECASE):
-            found_features.append(pattern)
+    found_features = find_words(card_text, CARD_POOL_SPA_PATTERNS)
     
     if found_features:
         return ', '.join(found_features[:3])  # Limit to first 3
     
     return 'Unknown'
 
-def extract_view_from_card(card) -> str:
-    """Extract view information from Redfin property card."""
-    card_text = card.get_text()
-    
+CARD_VIEW_PATTERNS = compile_words((
+    'Mountain View',
+    'Water View',
+    'City View',
+    'Lake View',
+    'River View',
+    'Golf Course View',
+    'Park View',
+    'Greenbelt View',
+    'Valley View',
+    'Panoramic View',
+    'Territorial View',
+    'Partial View',
+    'Peek View',
+    'View'
+))
+
+def extract_view_from_card(card_text: str) -> str:
+    """Extract view information from Redfin property card text."""
     # Look for view patterns
-    view_patterns = [
-        'Mountain View',
-        'Water View',
-        'City View',
-        'Lake View',
-        'River View',
-        'Golf Course View',
-        'Park View',
-        'Greenbelt View',
-        'Valley View',
-        'Panoramic View',
-        'Territorial View',
-        'Partial View',
-        'Peek View',
-        'View'
-    ]
-    
-    found_views = []
-    for pattern in view_patterns:
-        if re.search(rf'\b{re.escape(pattern)}\b', card_text, re.IGNORECASE):
-            found_views.append(pattern)
+    found_views = find_words(card_text, CARD_VIEW_PATTERNS)
     
     if found_views:
         return ', '.join(found_views[:3])  # Limit to first 3
     
     return 'Unknown'
 
-def extract_listing_agent_from_card(card) -> str:
-    """Extract listing agent information from Redfin property card."""
-    card_text = card.get_text()
-    
+CARD_AGENT_PATTERNS = [re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'Listed\s*by\s*([A-Za-z\s\.,]+)',       # "Listed by John Doe"
+    r'Agent\s*[:\-]?\s*([A-Za-z\s\.,]+)',    # "Agent: John Doe"
+    r'Listing\s*Agent\s*[:\-]?\s*([A-Za-z\s\.,]+)',  # "Listing Agent: John Doe"
+    r'Contact\s*([A-Za-z\s\.,]+)',           # "Contact John Doe"
+)]
+
+CARD_AGENT_SUFFIX_RE = re.compile(r'\s*(Realty|Real Estate|Realtor|Agent).*$', re.IGNORECASE)
+
+def extract_listing_agent_from_card(card_text: str) -> str:
+    """Extract listing agent information from Redfin property card text."""
     # Look for agent patterns
-    agent_patterns = [
-        r'Listed\s*by\s*([A-Za-z\s\.,]+)',       # "Listed by John Doe"
-        r'Agent\s*[:\-]?\s*([A-Za-z\s\.,]+)',    # "Agent: John Doe"
-        r'Listing\s*Agent\s*[:\-]?\s*([A-Za-z\s\.,]+)',  # "Listing Agent: John Doe"
-        r'Contact\s*([A-Za-z\s\.,]+)',           # "Contact John Doe"
-    ]
-    
-    for pattern in agent_patterns:
-        match = re.search(pattern, card_text, re.IGNORECASE)
+    for pattern in CARD_AGENT_PATTERNS:
+        match = pattern.search(card_text)
         if match:
             agent = match.group(1).strip()
             # Clean up common suffixes
-            agent = re.sub(r'\s*(Realty|Real Estate|Realtor|Agent).*$', '', agent, flags=re.IGNORECASE)
+            agent = CARD_AGENT_SUFFIX_RE.sub('', agent)
             if len(agent) > 3 and len(agent) < 50:  # Reasonable agent name length
                 return agent
     
     return 'Unknown'
 
-def extract_listing_status_from_card(card) -> str:
-    """Extract listing status from Redfin property card."""
-    card_text = card.get_text()
-    
+CARD_STATUS_PATTERNS = compile_words((
+    'Active',
+    'Pending',
+    'Under Contract',
+    'Sold',
+    'Off Market',
+    'Withdrawn',
+    'Expired',
+    'Coming Soon',
+    'New',
+    'Price Reduced',
+    'Back on Market',
+    'Contingent'
+))
+
+def extract_listing_status_from_card(card_text: str) -> str:
+    """Extract listing status from Redfin property card text."""
     # Look for status patterns
-    status_patterns = [
-        'Active',
-        'Pending',
-        'Under Contract',
-        'Sold',
-        'Off Market',
-        'Withdrawn',
-        'Expired',
-        'Coming Soon',
-        'New',
-        'Price Reduced',
-        'Back on Market',
-        'Contingent'
-    ]
-    
-    for pattern in status_patterns:
-        if re.search(rf'\b{re.escape(pattern)}\b', card_text, re.IGNORECASE):
-            return pattern
+    found = first_word(card_text, CARD_STATUS_PATTERNS)
+    if found:
+        return found
     
     return 'Active'  # Default assumption for Redfin listings
 
-def extract_price_per_sqft_from_card(card) -> str:
-    """Extract price per square foot from Redfin property card."""
-    card_text = card.get_text()
-    
+CARD_PRICE_SQFT_PATTERNS = [re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'\$([0-9,]+)\s*/?s?q?f?t?',           # "$150/sqft" or "$150 sqft"
+    r'([0-9,]+)\s*/?s?q?f?t?',             # "150/sqft" or "150 sqft"
+    r'Price\s*per\s*sq\s*ft\s*[:\-]?\s*\$?([0-9,]+)',  # "Price per sq ft: $150"
+)]
+
+def extract_price_per_sqft_from_card(card_text: str) -> str:
+    """Extract price per square foot from Redfin property card text."""
     # Look for price per sqft patterns
-    price_sqft_patterns = [
-        r'\$([0-9,]+)\s*/?s?q?f?t?',           # "$150/sqft" or "$150 sqft"
-        r'([0-9,]+)\s*/?s?q?f?t?',             # "150/sqft" or "150 sqft"
-        r'Price\s*per\s*sq\s*ft\s*[:\-]?\s*\$?([0-9,]+)',  # "Price per sq ft: $150"
-    ]
-    
-    for pattern in price_sqft_patterns:
-        match = re.search(pattern, card_text, re.IGNORECASE)
+    for pattern in CARD_PRICE_SQFT_PATTERNS:
+        match = pattern.search(card_text)
         if match:
             try:
                 price_str = match.group(1).replace(',', '')
@@ -1023,22 +1028,20 @@ def extract_price_per_sqft_from_card(card) -> str:
     
     return 'Unknown'
 
-def extract_school_district_from_card(card) -> str:
-    """Extract school district information from Redfin property card."""
-    card_text = card.get_text()
-    
+CARD_SCHOOL_PATTERNS = [re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'School\s*District\s*[:\-]?\s*([A-Za-z0-9\s\-]+)',     # "School District: ABC"
+    r'District\s*[:\-]?\s*([A-Za-z0-9\s\-]+)',             # "District: ABC"
+    r'Schools?\s*[:\-]?\s*([A-Za-z0-9\s\-]+)',             # "School: ABC"
+    r'Elementary\s*[:\-]?\s*([A-Za-z0-9\s\-]+)',           # "Elementary: ABC"
+    r'Middle\s*School\s*[:\-]?\s*([A-Za-z0-9\s\-]+)',      # "Middle School: ABC"
+    r'High\s*School\s*[:\-]?\s*([A-Za-z0-9\s\-]+)',        # "High School: ABC"
+)]
+
+def extract_school_district_from_card(card_text: str) -> str:
+    """Extract school district information from Redfin property card text."""
     # Look for school district patterns
-    school_patterns = [
-        r'School\s*District\s*[:\-]?\s*([A-Za-z0-9\s\-]+)',     # "School District: ABC"
-        r'District\s*[:\-]?\s*([A-Za-z0-9\s\-]+)',             # "District: ABC"
-        r'Schools?\s*[:\-]?\s*([A-Za-z0-9\s\-]+)',             # "School: ABC"
-        r'Elementary\s*[:\-]?\s*([A-Za-z0-9\s\-]+)',           # "Elementary: ABC"
-        r'Middle\s*School\s*[:\-]?\s*([A-Za-z0-9\s\-]+)',      # "Middle School: ABC"
-        r'High\s*School\s*[:\-]?\s*([A-Za-z0-9\s\-]+)',        # "High School: ABC"
-    ]
-    
-    for pattern in school_patterns:
-        match = re.search(pattern, card_text, re.IGNORECASE)
+    for pattern in CARD_SCHOOL_PATTERNS:
+        match = pattern.search(card_text)
         if match:
             school = match.group(1).strip()
             if len(school) > 3 and len(school) < 100:  # Reasonable school name length
@@ -1046,52 +1049,45 @@ def extract_school_district_from_card(card) -> str:
     
     return 'Unknown'
 
-def extract_utilities_from_card(card) -> str:
-    """Extract utilities information from Redfin property card."""
-    card_text = card.get_text()
-    
+CARD_UTILITY_PATTERNS = compile_words((
+    'Public Water',
+    'Well Water',
+    'City Water',
+    'Public Sewer',
+    'Septic',
+    'Private Sewer',
+    'Electric',
+    'Gas',
+    'Propane',
+    'Oil',
+    'Solar',
+    'Cable Ready',
+    'Fiber Optic',
+    'High Speed Internet'
+))
+
+def extract_utilities_from_card(card_text: str) -> str:
+    """Extract utilities information from Redfin property card text."""
     # Look for utility patterns
-    utility_patterns = [
-        'Public Water',
-        'Well Water',
-        'City Water',
-        'Public Sewer',
-        'Septic',
-        'Private Sewer',
-        'Electric',
-        'Gas',
-        'Propane',
-        'Oil',
-        'Solar',
-        'Cable Ready',
-        'Fiber Optic',
-        'High Speed Internet'
-    ]
-    
-    found_utilities = []
-    for pattern in utility_patterns:
-        if re.search(rf'\b{re.escape(pattern)}\b', card_text, re.IGNORECASE):
-            found_utilities.append(pattern)
+    found_utilities = find_words(card_text, CARD_UTILITY_PATTERNS)
     
     if found_utilities:
         return ', '.join(found_utilities[:4])  # Limit to first 4
     
     return 'Unknown'
 
-def extract_neighborhood_from_card(card) -> str:
-    """Extract neighborhood/subdivision information from Redfin property card."""
-    card_text = card.get_text()
-    
+CARD_NEIGHBORHOOD_PATTERNS = [re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'Neighborhood\s*[:\-]?\s*([A-Za-z0-9\s\-]+)',         # "Neighborhood: ABC"
+    r'Subdivision\s*[:\-]?\s*([A-Za-z0-9\s\-]+)',          # "Subdivision: ABC"
+    r'Community\s*[:\-]?\s*([A-Za-z0-9\s\-]+)',            # "Community: ABC"
+    r'Development\s*[:\-]?\s*([A-Za-z0-9\s\-]+)',          # "Development: ABC"
+)]
+
+def extract_neighborhood_from_card(card_text: str) -> str:
+    """Extract neighborhood/subdivision information from Redfin property card text."""
     # Look for neighborhood patterns
-    neighborhood_patterns = [
-        r'Neighborhood\s*[:\-]?\s*([A-Za-z0-9\s\-]+)',         # "Neighborhood: ABC"
-        r'Subdivision\s*[:\-]?\s*([A-Za-z0-9\s\-]+)',          # "Subdivision: ABC"
-        r'Community\s*[:\-]?\s*([A-Za-z0-9\s\-]+)',            # "Community: ABC"
-        r'Development\s*[:\-]?\s*([A-Za-z0-9\s\-]+)',          # "Development: ABC"
-    ]
-    
-    for pattern in neighborhood_patterns:
-        match = re.search(pattern, card_text, re.IGNORECASE)
+    for pattern in CARD_NEIGHBORHOOD_PATTERNS:
+        match = pattern.search(card_text)
         if match:
             neighborhood = match.group(1).strip()
             if len(neighborhood) > 3 and len(neighborhood) < 100:  # Reasonable name length
@@ -1099,55 +1095,51 @@ def extract_neighborhood_from_card(card) -> str:
     
     return 'Unknown'
 
-def extract_open_house_from_card(card) -> str:
-    """Extract open house information from Redfin property card."""
-    card_text = card.get_text()
-    
+CARD_OPEN_HOUSE_PATTERNS = [re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'Open\s*House\s*[:\-]?\s*([A-Za-z0-9\s\-\/,:]+)',     # "Open House: Sat 1-3pm"
+    r'Open\s*([A-Za-z0-9\s\-\/,:]+)',                      # "Open Sat 1-3pm"
+    r'Tour\s*[:\-]?\s*([A-Za-z0-9\s\-\/,:]+)',             # "Tour: Available"
+)]
+
+CARD_OPEN_HOUSE_INDICATORS = compile_words((
+    'Virtual Tour',
+    'Online Tour',
+    '3D Tour',
+    'Video Tour',
+    'Open House',
+    'Tour Available'
+))
+
+def extract_open_house_from_card(card_text: str) -> str:
+    """Extract open house information from Redfin property card text."""
     # Look for open house patterns
-    open_house_patterns = [
-        r'Open\s*House\s*[:\-]?\s*([A-Za-z0-9\s\-\/,:]+)',     # "Open House: Sat 1-3pm"
-        r'Open\s*([A-Za-z0-9\s\-\/,:]+)',                      # "Open Sat 1-3pm"
-        r'Tour\s*[:\-]?\s*([A-Za-z0-9\s\-\/,:]+)',             # "Tour: Available"
-    ]
-    
-    for pattern in open_house_patterns:
-        match = re.search(pattern, card_text, re.IGNORECASE)
+    for pattern in CARD_OPEN_HOUSE_PATTERNS:
+        match = pattern.search(card_text)
         if match:
             open_house = match.group(1).strip()
             if len(open_house) > 3 and len(open_house) < 100:  # Reasonable length
                 return open_house
     
     # Look for simple indicators
-    open_house_indicators = [
-        'Virtual Tour',
-        'Online Tour',
-        '3D Tour',
-        'Video Tour',
-        'Open House',
-        'Tour Available'
-    ]
-    
-    for indicator in open_house_indicators:
-        if re.search(rf'\b{re.escape(indicator)}\b', card_text, re.IGNORECASE):
-            return indicator
+    found = first_word(card_text, CARD_OPEN_HOUSE_INDICATORS)
+    if found:
+        return found
     
     return 'Unknown'
 
-def extract_previous_price_from_card(card) -> str:
-    """Extract previous/original price information from Redfin property card."""
-    card_text = card.get_text()
-    
+CARD_PREVIOUS_PRICE_PATTERNS = [re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'Was\s*\$([0-9,]+)',                    # "Was $450,000"
+    r'Originally\s*\$([0-9,]+)',             # "Originally $450,000"
+    r'Previous\s*Price\s*[:\-]?\s*\$([0-9,]+)',  # "Previous Price: $450,000"
+    r'Reduced\s*from\s*\$([0-9,]+)',         # "Reduced from $450,000"
+    r'Price\s*Drop\s*[:\-]?\s*\$([0-9,]+)',  # "Price Drop: $450,000"
+)]
+
+def extract_previous_price_from_card(card_text: str) -> str:
+    """Extract previous/original price information from Redfin property card text."""
     # Look for previous price patterns
-    price_patterns = [
-        r'Was\s*\$([0-9,]+)',                    # "Was $450,000"
-        r'Originally\s*\$([0-9,]+)',             # "Originally $450,000"
-        r'Previous\s*Price\s*[:\-]?\s*\$([0-9,]+)',  # "Previous Price: $450,000"
-        r'Reduced\s*from\s*\$([0-9,]+)',         # "Reduced from $450,000"
-        r'Price\s*Drop\s*[:\-]?\s*\$([0-9,]+)',  # "Price Drop: $450,000"
-    ]
-    
-    for pattern in price_patterns:
-        match = re.search(pattern, card_text, re.IGNORECASE)
+    for pattern in CARD_PREVIOUS_PRICE_PATTERNS:
+        match = pattern.search(card_text)
         if match:
             try:
                 price_str = match.group(1).replace(',', '')
@@ -1159,19 +1151,17 @@ def extract_previous_price_from_card(card) -> str:
     
     return 'Unknown'
 
-def extract_walk_score_from_card(card) -> str:
-    """Extract walk score information from Redfin property card."""
-    card_text = card.get_text()
-    
+CARD_WALK_SCORE_PATTERNS = [re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'Walk\s*Score\s*[:\-]?\s*(\d+)',        # "Walk Score: 75"
+    r'Walkability\s*[:\-]?\s*(\d+)',         # "Walkability: 75"
+    r'(\d+)\s*Walk\s*Score',                 # "75 Walk Score"
+)]
+
+def extract_walk_score_from_card(card_text: str) -> str:
+    """Extract walk score information from Redfin property card text."""
     # Look for walk score patterns
-    walk_score_patterns = [
-        r'Walk\s*Score\s*[:\-]?\s*(\d+)',        # "Walk Score: 75"
-        r'Walkability\s*[:\-]?\s*(\d+)',         # "Walkability: 75"
-        r'(\d+)\s*Walk\s*Score',                 # "75 Walk Score"
-    ]
-    
-    for pattern in walk_score_patterns:
-        match = re.search(pattern, card_text, re.IGNORECASE)
+    for pattern in CARD_WALK_SCORE_PATTERNS:
+        match = pattern.search(card_text)
         if match:
             try:
                 score = int(match.group(1))
@@ -1182,20 +1172,18 @@ def extract_walk_score_from_card(card) -> str:
     
     return 'Unknown'
 
-def extract_monthly_payment_from_card(card) -> str:
-    """Extract estimated monthly payment from Redfin property card."""
-    card_text = card.get_text()
-    
+CARD_PAYMENT_PATTERNS = [re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'Monthly\s*Payment\s*[:\-]?\s*\$([0-9,]+)',     # "Monthly Payment: $2,500"
+    r'Est\s*Payment\s*[:\-]?\s*\$([0-9,]+)',         # "Est Payment: $2,500"
+    r'Payment\s*[:\-]?\s*\$([0-9,]+)/mo',            # "Payment: $2,500/mo"
+    r'\$([0-9,]+)/mo',                               # "$2,500/mo"
+)]
+
+def extract_monthly_payment_from_card(card_text: str) -> str:
+    """Extract estimated monthly payment from Redfin property card text."""
     # Look for monthly payment patterns
-    payment_patterns = [
-        r'Monthly\s*Payment\s*[:\-]?\s*\$([0-9,]+)',     # "Monthly Payment: $2,500"
-        r'Est\s*Payment\s*[:\-]?\s*\$([0-9,]+)',         # "Est Payment: $2,500"
-        r'Payment\s*[:\-]?\s*\$([0-9,]+)/mo',            # "Payment: $2,500/mo"
-        r'\$([0-9,]+)/mo',                               # "$2,500/mo"
-    ]
-    
-    for pattern in payment_patterns:
-        match = re.search(pattern, card_text, re.IGNORECASE)
+    for pattern in CARD_PAYMENT_PATTERNS:
+        match = pattern.search(card_text)
         if match:
             try:
                 payment_str = match.group(1).replace(',', '')
@@ -1207,21 +1195,19 @@ def extract_monthly_payment_from_card(card) -> str:
     
     return 'Unknown'
 
-def extract_photo_count_from_card(card) -> str:
-    """Extract photo count from Redfin property card."""
-    card_text = card.get_text()
-    
+CARD_PHOTO_PATTERNS = [re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'(\d+)\s*Photo',                     # "25 Photo"
+    r'(\d+)\s*Photos',                    # "25 Photos"
+    r'(\d+)\s*Image',                     # "25 Image"
+    r'(\d+)\s*Images',                    # "25 Images"
+    r'Photos?\s*[:\-]?\s*(\d+)',          # "Photos: 25"
+)]
+
+def extract_photo_count_from_card(card_text: str) -> str:
+    """Extract photo count from Redfin property card text."""
     # Look for photo count patterns
-    photo_patterns = [
-        r'(\d+)\s*Photo',                     # "25 Photo"
-        r'(\d+)\s*Photos',                    # "25 Photos"
-        r'(\d+)\s*Image',                     # "25 Image"
-        r'(\d+)\s*Images',                    # "25 Images"
-        r'Photos?\s*[:\-]?\s*(\d+)',          # "Photos: 25"
-    ]
-    
-    for pattern in photo_patterns:
-        match = re.search(pattern, card_text, re.IGNORECASE)
+    for pattern in CARD_PHOTO_PATTERNS:
+        match = pattern.search(card_text)
         if match:
             try:
                 count = int(match.group(1))
@@ -1232,212 +1218,198 @@ def extract_photo_count_from_card(card) -> str:
     
     return 'Unknown'
 
-def extract_fence_from_card(card) -> str:
-    """Extract fence information from Redfin property card."""
-    card_text = card.get_text()
-    
+CARD_FENCE_PATTERNS = compile_words((
+    'Fenced Yard',
+    'Fenced',
+    'Privacy Fence',
+    'Chain Link Fence',
+    'Wood Fence',
+    'Vinyl Fence',
+    'Partial Fence',
+    'Fully Fenced',
+    'Back Yard Fenced',
+    'Front Yard Fenced'
+))
+
+def extract_fence_from_card(card_text: str) -> str:
+    """Extract fence information from Redfin property card text."""
     # Look for fence patterns
-    fence_patterns = [
-        'Fenced Yard',
-        'Fenced',
-        'Privacy Fence',
-        'Chain Link Fence',
-        'Wood Fence',
-        'Vinyl Fence',
-        'Partial Fence',
-        'Fully Fenced',
-        'Back Yard Fenced',
-        'Front Yard Fenced'
-    ]
-    
-    found_fencing = []
-    for pattern in fence_patterns:
-        if re.search(rf'\b{re.escape(pattern)}\b', card_text, re.IGNORECASE):
-            found_fencing.append(pattern)
+    found_fencing = find_words(card_text, CARD_FENCE_PATTERNS)
     
     if found_fencing:
         return ', '.join(found_fencing[:2])  # Limit to first 2
     
     return 'Unknown'
 
-def fetch_redfin_properties() -> list[dict]:
-    """Fetch Redfin properties from both Spokane City and County with enhanced data."""
-    all_properties = []
+def parse_source(source_name: str, html: str | bytes, show_raw_text: bool = False) -> list[dict]:
+    """Parse one Redfin results page into property dicts with enhanced data."""
+    properties = []
+    tree = parse_html(html)
     
-    for source_name, url in REDFIN_SOURCES.items():
-        logging.info("Fetching properties from %s...", source_name)
-        try:
-            response = ROBUST_SESSION.get(url, headers=HDRS, timeout=45)
-            response.raise_for_status()
-            html = response.text
-            soup = BeautifulSoup(html, "html.parser")
-            
-            for card in soup.select("div.HomeCardContainer"):
-                a = card.find("a", href=True)
-                disp = card.select_one("div.homeAddressV2")
-                if not a:
-                    continue
-                
-                street = extract_street(disp.text if disp else None, a["href"])
-                if not street:
-                    continue
-                
-                # Extract existing sqft data
-                sqft = 0
-                sqft_selectors = [
-                    "div.stats span:contains('Sq Ft')",
-                    "div.homeStatsV2 span:contains('Sq Ft')", 
-                    "div.HomeStatsV2 span:contains('Sq Ft')",
-                    "span.sqft-value",
-                    "span.value:contains('Sq Ft')",
-                    "[data-rf-test-id='abp-sqFt']",
-                    ".sqft"
-                ]
-                
-                for selector in sqft_selectors:
-                    try:
-                        sqft_elem = card.select_one(selector)
-                        if sqft_elem:
-                            sqft_text = sqft_elem.get_text()
-                            sqft_match = re.search(r'([\d,]+)', sqft_text)
-                            if sqft_match:
-                                sqft = int(sqft_match.group(1).replace(',', ''))
-                                break
-                    except:
-                        continue
-                
-                # Fallback sqft extraction
-                if sqft == 0:
-                    card_text = card.get_text()
-                    sqft_patterns = [
-                        r'([\d,]+)\s*[Ss]q\s*[Ff]t',
-                        r'([\d,]+)\s*[Ss]quare\s*[Ff]eet',
-                        r'([\d,]+)\s*SF\b'
-                    ]
-                    
-                    for pattern in sqft_patterns:
-                        match = re.search(pattern, card_text)
-                        if match:
-                            try:
-                                sqft = int(match.group(1).replace(',', ''))
-                                break
-                            except ValueError:
-                                continue
-                
-                # Extract new data fields
-                price = extract_price_from_card(card)
-                lot_size_acres = extract_lot_size_from_card(card)
-                post_date = clean_date_string(extract_post_date_from_card(card, args.show_raw_text))
-                
-                # In raw text mode, skip the rest of processing for this property
-                if args.show_raw_text:
-                    # Show only first 5 properties by default in raw text mode
-                    if i >= 5:
-                        print(f"\n✅ Shown first 5 properties. Use --limit to see more.")
-                        return
-                    continue
-                
-                # Extract additional property details
-                bedrooms = extract_bedrooms_from_card(card)
-                bathrooms = extract_bathrooms_from_card(card)
-                property_type = extract_property_type_from_card(card)
-                year_built = extract_year_built_from_card(card)
-                days_on_market = extract_days_on_market_from_card(card)
-                garage_parking = extract_garage_parking_from_card(card)
-                
-                # Extract ALL NEW FIELDS for comprehensive data
-                mls_number = extract_mls_number_from_card(card)
-                hoa_fee = extract_hoa_fee_from_card(card)
-                property_taxes = extract_property_taxes_from_card(card)
-                stories = extract_stories_from_card(card)
-                basement = extract_basement_from_card(card)
-                heating_cooling = extract_heating_cooling_from_card(card)
-                flooring = extract_flooring_from_card(card)
-                appliances = extract_appliances_from_card(card)
-                fireplace = extract_fireplace_from_card(card)
-                pool_spa = extract_pool_spa_from_card(card)
-                view = extract_view_from_card(card)
-                listing_agent = extract_listing_agent_from_card(card)
-                listing_status = extract_listing_status_from_card(card)
-                price_per_sqft = extract_price_per_sqft_from_card(card)
-                school_district = extract_school_district_from_card(card)
-                utilities = extract_utilities_from_card(card)
-                neighborhood = extract_neighborhood_from_card(card)
-                open_house = extract_open_house_from_card(card)
-                previous_price = extract_previous_price_from_card(card)
-                walk_score = extract_walk_score_from_card(card)
-                monthly_payment = extract_monthly_payment_from_card(card)
-                photo_count = extract_photo_count_from_card(card)
-                fence = extract_fence_from_card(card)
-                
-                all_properties.append({
-                    # Original fields
-                    'street': street,
-                    'sqft': sqft,
-                    'price': price,
-                    'lot_size_acres': lot_size_acres,
-                    'post_date': post_date,
-                    'bedrooms': bedrooms,
-                    'bathrooms': bathrooms,
-                    'property_type': property_type,
-                    'year_built': year_built,
-                    'days_on_market': days_on_market,
-                    'garage_parking': garage_parking,
-                    'source': source_name,
-                    
-                    # NEW COMPREHENSIVE FIELDS
-                    'mls_number': mls_number,
-                    'hoa_fee': hoa_fee,
-                    'property_taxes': property_taxes,
-                    'stories': stories,
-                    'basement': basement,
-                    'heating_cooling': heating_cooling,
-                    'flooring': flooring,
-                    'appliances': appliances,
-                    'fireplace': fireplace,
-                    'pool_spa': pool_spa,
-                    'view': view,
-                    'listing_agent': listing_agent,
-                    'listing_status': listing_status,
-                    'price_per_sqft': price_per_sqft,
-                    'school_district': school_district,
-                    'utilities': utilities,
-                    'neighborhood': neighborhood,
-                    'open_house': open_house,
-                    'previous_price': previous_price,
-                    'walk_score': walk_score,
-                    'monthly_payment': monthly_payment,
-                    'photo_count': photo_count,
-                    'fence': fence
-                })
-            
-            logging.info("Found %d properties from %s", 
-                        len([p for p in all_properties if p['source'] == source_name]), source_name)
-                        
-        except Exception as e:
-            logging.error("Error fetching from %s: %s", source_name, str(e))
+    for i, card in enumerate(tree.css("div.HomeCardContainer"), 1):
+        a = card.css_first("a[href]")
+        disp = card.css_first("div.homeAddressV2")
+        if not a:
+            continue
+        
+        street = extract_street(disp.text() if disp else None, a.attributes.get("href"))
+        if not street:
             continue
+        
+        # Walk the card's text once and share it between all the field extractors
+        card_text = card.text()
+        sqft = extract_sqft_from_card(card_text)
+        
+        # Extract new data fields
+        price = extract_price_from_card(card_text)
+        lot_size_acres = extract_lot_size_from_card(card_text)
+        post_date = clean_date_string(extract_post_date_from_card(card_text, show_raw_text))
+        
+        # In raw text mode, skip the rest of processing for this property
+        if show_raw_text:
+            # Show only first 5 properties by default in raw text mode
+            if i >= 5:
+                print(f"\n✅ Shown first 5 properties. Use --limit to see more.")
+                break
+            continue
+        
+        # Extract additional property details
+        bedrooms = extract_bedrooms_from_card(card_text)
+        bathrooms = extract_bathrooms_from_card(card_text)
+        property_type = extract_property_type_from_card(card_text)
+        year_built = extract_year_built_from_card(card_text)
+        days_on_market = extract_days_on_market_from_card(card_text)
+        garage_parking = extract_garage_parking_from_card(card_text)
+        
+        # Extract ALL NEW FIELDS for comprehensive data
+        mls_number = extract_mls_number_from_card(card_text)
+        hoa_fee = extract_hoa_fee_from_card(card_text)
+        property_taxes = extract_property_taxes_from_card(card_text)
+        stories = extract_stories_from_card(card_text)
+        basement = extract_basement_from_card(card_text)
+        heating_cooling = extract_heating_cooling_from_card(card_text)
+        flooring = extract_flooring_from_card(card_text)
+        appliances = extract_appliances_from_card(card_text)
+        fireplace = extract_fireplace_from_card(card_text)
+        pool_spa = extract_pool_spa_from_card(card_text)
+        view = extract_view_from_card(card_text)
+        listing_agent = extract_listing_agent_from_card(card_text)
+        listing_status = extract_listing_status_from_card(card_text)
+        price_per_sqft = extract_price_per_sqft_from_card(card_text)
+        school_district = extract_school_district_from_card(card_text)
+        utilities = extract_utilities_from_card(card_text)
+        neighborhood = extract_neighborhood_from_card(card_text)
+        open_house = extract_open_house_from_card(card_text)
+        previous_price = extract_previous_price_from_card(card_text)
+        walk_score = extract_walk_score_from_card(card_text)
+        monthly_payment = extract_monthly_payment_from_card(card_text)
+        photo_count = extract_photo_count_from_card(card_text)
+        fence = extract_fence_from_card(card_text)
+        
+        properties.append({
+            # Original fields
+            'street': street,
+            'sqft': sqft,
+            'price': price,
+            'lot_size_acres': lot_size_acres,
+            'post_date': post_date,
+            'bedrooms': bedrooms,
+            'bathrooms': bathrooms,
+            'property_type': property_type,
+            'year_built': year_built,
+            'days_on_market': days_on_market,
+            'garage_parking': garage_parking,
+            'source': source_name,
+            
+            # NEW COMPREHENSIVE FIELDS
+            'mls_number': mls_number,
+            'hoa_fee': hoa_fee,
+            'property_taxes': property_taxes,
+            'stories': stories,
+            'basement': basement,
+            'heating_cooling': heating_cooling,
+            'flooring': flooring,
+            'appliances': appliances,
+            'fireplace': fireplace,
+            'pool_spa': pool_spa,
+            'view': view,
+            'listing_agent': listing_agent,
+            'listing_status': listing_status,
+            'price_per_sqft': price_per_sqft,
+            'school_district': school_district,
+            'utilities': utilities,
+            'neighborhood': neighborhood,
+            'open_house': open_house,
+            'previous_price': previous_price,
+            'walk_score': walk_score,
+            'monthly_payment': monthly_payment,
+            'photo_count': photo_count,
+            'fence': fence
+        })
+    
+    return properties
+
+def fetch_source(source_name: str, url: str, show_raw_text: bool = False) -> list[dict]:
+    """Download and parse a single Redfin results page."""
+    logging.info("Fetching properties from %s...", source_name)
+    response = ROBUST_SESSION.get(url, timeout=HTTP_TIMEOUT)
+    response.raise_for_status()
+    # Hand Lexbor the raw UTF-8 body instead of decoding it to a str first
+    properties = parse_source(source_name, response.content, show_raw_text)
+    logging.info("Found %d properties from %s", len(properties), source_name)
+    return properties
+
+def fetch_redfin_properties(show_raw_text: bool = False) -> list[dict]:
+    """Fetch Redfin properties from every REDFIN_SOURCES page concurrently."""
+    sources = list(REDFIN_SOURCES.items())
+    if show_raw_text:
+        sources = sources[:1]  # Raw text dump only needs the first page
+    
+    results = {}
+    with ThreadPoolExecutor(max_workers=len(sources)) as executor:
+        futures = {executor.submit(fetch_source, name, url, show_raw_text): name for name, url in sources}
+        for future in as_completed(futures):
+            source_name = futures[future]
+            try:
+                results[source_name] = future.result()
+            except Exception as e:
+                logging.error("Error fetching from %s: %s", source_name, str(e))
+    
+    # Merge in REDFIN_SOURCES order so --limit picks the same properties every run.
+    # Listings can shift between result pages while they are fetched, so keep only
+    # the first card per street (everything downstream is keyed by street).
+    all_properties = []
+    seen_streets = set()
+    for source_name, _ in sources:
+        for prop in results.get(source_name, ()):
+            if prop['street'] not in seen_streets:
+                seen_streets.add(prop['street'])
+                all_properties.append(prop)
     
     logging.info("Total properties found: %d", len(all_properties))
     return all_properties
 
 
 
+@lru_cache(maxsize=4096)
 def arcgis_pid(street: str) -> str | None:
     """Get PID from SCOUT with robust error handling and retries."""
     params = {
         "f":"json",
         "where": f"site_address LIKE '{street}%'",
         "outFields":"PID_NUM",
-        "returnGeometry":"false"
+        "returnGeometry":"false",
+        # Only the first match is used, so let the server stop there
+        "resultOffset": 0,
+        "resultRecordCount": 1,
     }
     
     max_attempts = 3
     for attempt in range(max_attempts):
         try:
-            response = ROBUST_SESSION.get(SCOUT_LAYER, params=params, timeout=45)
+            response = ROBUST_SESSION.get(SCOUT_LAYER, params=params, timeout=HTTP_TIMEOUT)
             response.raise_for_status()  # Raise exception for HTTP errors
-            js = response.json()
+            js = orjson.loads(response.content)
             
             feats = js.get("features") or []
             if not feats:
@@ -1469,42 +1441,101 @@ def arcgis_pid(street: str) -> str | None:
     
     return None
 
-def extract_lot_size_from_scout(text: str) -> float:
-    """Extract lot size in acres from SCOUT data."""
-    # Look for patterns like "6540 Square Feet" or "5 Acre(s)" or "1.3 Acre(s)"
-    # These appear after the city name in the Site Address section
+def arcgis_pids_batch(streets: list[str]) -> dict[str, str | None]:
+    """Resolve many streets to PIDs with one SCOUT query per SCOUT_BATCH_SIZE streets.
     
-    # Pattern for acres
-    acre_match = re.search(r'(\d+\.?\d*)\s+Acre\(s\)', text)
-    if acre_match:
+    Truncated results are paged with resultOffset (up to SCOUT_BATCH_MAX_PAGES pages).
+    Streets from a failed batch query, or still unresolved after the last page, fall
+    back to arcgis_pid; streets whose fallback lookup raised are left out of the result.
+    """
+    pids = {}
+    fallback = []
+    for start in range(0, len(streets), SCOUT_BATCH_SIZE):
+        chunk = streets[start:start + SCOUT_BATCH_SIZE]
+        params = {
+            "f":"json",
+            "where": " OR ".join("site_address LIKE '%s%%'" % street.replace("'", "''") for street in chunk),
+            "outFields":"PID_NUM,site_address",
+            "returnGeometry":"false",
+            "resultOffset": 0,
+        }
+        pending = list(chunk)
         try:
-            return float(acre_match.group(1))
-        except ValueError:
-            pass
+            for _ in range(SCOUT_BATCH_MAX_PAGES):
+                # POST form body: the OR'ed where clause is too long for a safe GET URL
+                response = ROBUST_SESSION.post(SCOUT_LAYER, data=params, timeout=HTTP_TIMEOUT)
+                response.raise_for_status()
+                js = orjson.loads(response.content)
+                feats = js.get("features") or []
+                # Upper-case each address once, not once per street it is compared with
+                addresses = [((feat["attributes"].get("site_address") or "").upper(),
+                              feat["attributes"].get("PID_NUM")) for feat in feats]
+                
+                unresolved = []
+                for street in pending:
+                    # First prefix match in server order, same as the single-street query
+                    pid = next((pid for address, pid in addresses if address.startswith(street)), None)
+                    if pid:
+                        pids[street] = pid
+                    else:
+                        unresolved.append(street)
+                pending = unresolved
+                
+                if not pending or not js.get("exceededTransferLimit") or not feats:
+                    break
+                params["resultOffset"] += len(feats)  # Next page of the truncated result
+        except (requests.exceptions.RequestException, KeyError, ValueError, TypeError) as e:
+            logging.warning("→ Batch PID lookup failed for %d streets, retrying one by one: %s", len(pending), str(e))
+            fallback.extend(pending)
+            continue
+        
+        if js.get("exceededTransferLimit"):
+            fallback.extend(pending)  # Their matches may be beyond the pages read
+        else:
+            for street in pending:
+                logging.warning("→ No PID for %r", street)
+                pids[street] = None
     
-    # Pattern for square feet
-    sqft_match = re.search(r'(\d+)\s+Square Feet', text)
-    if sqft_match:
-        try:
-            sqft = int(sqft_match.group(1))
-            return round(sqft / 43560, 3)  # Convert to acres
-        except ValueError:
-            pass
+    if fallback:
+        with ThreadPoolExecutor(max_workers=SCOUT_MAX_WORKERS) as executor:
+            futures = {executor.submit(arcgis_pid, street): street for street in fallback}
+            for future in as_completed(futures):
+                street = futures[future]
+                try:
+                    pids[street] = future.result()
+                except Exception as e:
+                    logging.error("→ Unexpected error looking up %s: %s", street, str(e))
     
+    return pids
+
+def extract_lot_size_from_scout(text: str) -> float:
+    """Extract lot size in acres from SCOUT data."""
+    # Look for patterns like "6540 Square Feet" or "5 Acre(s)" or "1.3 Acre(s)"
+    # These appear after the city name in the Site Address section.
+    # An acreage anywhere on the page wins over a square-feet figure.
+    sqft = None
+    for match in SCOUT_LOT_SIZE_RE.finditer(text):
+        if match.group(1):
+            return float(match.group(1))
+        if sqft is None:
+            sqft = int(match.group(2))
+    
+    if sqft is not None:
+        return round(sqft / SQFT_PER_ACRE, 3)  # Convert to acres
     return 0.0
 
-def extract_jurisdiction_from_scout(text: str, html: str) -> str:
+def extract_jurisdiction_from_scout(text: str) -> str:
     """Extract jurisdiction (Valley/County/City) from SCOUT data."""
     # Look for the city in the Site Address section
     # Pattern: Site Address Parcel Type Site Address City Land Size...
-    city_match = re.search(r'Site Address\s+([A-Z\s]+?)\s+(?:\d+\s+Square Feet|\d+\.?\d*\s+Acre)', text)
+    city_match = SCOUT_CITY_RE.search(text)
     if city_match:
         city = city_match.group(1).strip()
         if city == "SPOKANE":
             # Look at tax code to determine if it's City of Spokane vs Spokane County
             # Tax codes starting with 0xxx are typically City of Spokane
             # Tax codes like 1280, higher numbers might be county/valley
-            tax_code_match = re.search(r'Tax Code Area Status.*?(\d{4})', text)
+            tax_code_match = SCOUT_TAX_CODE_RE.search(text)
             if tax_code_match:
                 tax_code = tax_code_match.group(1)
                 if tax_code.startswith('0'):
@@ -1516,25 +1547,29 @@ def extract_jurisdiction_from_scout(text: str, html: str) -> str:
             return city.title()
     
     # Fallback patterns
-    if 'SPOKANE VALLEY' in text.upper():
+    upper_text = text.upper()
+    if 'SPOKANE VALLEY' in upper_text:
         return 'Spokane Valley'
-    elif 'SPOKANE' in text.upper():
+    elif 'SPOKANE' in upper_text:
         return 'City of Spokane'
     
     return "Unknown"
 
-def legal_for_pid(pid: str) -> tuple[str, str, str]:
+@lru_cache(maxsize=4096)
+def legal_for_pid(pid: str) -> tuple[str, str]:
     """Get legal description from SCOUT with robust error handling and retries."""
     max_attempts = 3
     for attempt in range(max_attempts):
         try:
-            response = ROBUST_SESSION.get(SCOUT_SUMMARY.format(pid), headers=HDRS, timeout=45)
+            response = ROBUST_SESSION.get(SCOUT_SUMMARY.format(pid), timeout=HTTP_TIMEOUT)
             response.raise_for_status()  # Raise exception for HTTP errors
-            html = response.text
-            
-            text = BeautifulSoup(html, "html.parser").get_text(separator="\n")
-            jurisdiction = extract_jurisdiction_from_scout(text, html)
-            return text, html, jurisdiction
+            # Hand Lexbor the raw body; it decodes the UTF-8 itself, so requests'
+            # str decode (and Lexbor's re-encode of that str) is skipped. Only the
+            # page text is kept; every field downstream is read from it, so the raw
+            # HTML is not carried along with each record.
+            text = scout_page_text(response.content)
+            jurisdiction = extract_jurisdiction_from_scout(text)
+            return text, jurisdiction
             
         except requests.exceptions.Timeout:
             logging.warning("→ Timeout attempt %d/%d for SCOUT summary PID %s", attempt + 1, max_attempts, pid)
@@ -1544,7 +1579,7 @@ def legal_for_pid(pid: str) -> tuple[str, str, str]:
             else:
                 logging.error("→ Final timeout for SCOUT summary PID %s", pid)
                 # Return empty data to allow processing to continue
-                return "", "", "Unknown"
+                return "", "Unknown"
                 
         except requests.exceptions.RequestException as e:
             logging.warning("→ Network error attempt %d/%d for SCOUT summary PID %s: %s", attempt + 1, max_attempts, pid, str(e))
@@ -1553,25 +1588,72 @@ def legal_for_pid(pid: str) -> tuple[str, str, str]:
                 continue
             else:
                 logging.error("→ Final network error for SCOUT summary PID %s", pid)
-                return "", "", "Unknown"
+                return "", "Unknown"
                 
         except Exception as e:
             logging.error("→ Parsing error for SCOUT summary PID %s: %s", pid, str(e))
-            return "", "", "Unknown"
+            return "", "Unknown"
+    
+    return "", "Unknown"
+
+def fetch_scout_records(streets: list[str]) -> dict[str, tuple[str | None, str, str]]:
+    """Resolve streets to PIDs in batches, then pull the SCOUT summaries concurrently.
+    
+    Returns (pid, text, jurisdiction) per street. Streets whose lookup raised are
+    left out of the result so the caller can count them as failed.
+    """
+    records = {}
+    unique_streets = list(dict.fromkeys(streets))
+    logging.info("Resolving %d streets to PIDs in SCOUT (%d per query)...", len(unique_streets), SCOUT_BATCH_SIZE)
+    pids = arcgis_pids_batch(unique_streets)
+    
+    resolved = {}
+    for street in unique_streets:
+        if street not in pids:
+            continue  # Lookup raised; already logged by arcgis_pids_batch
+        if pids[street]:
+            resolved[street] = pids[street]
+        else:
+            records[street] = (None, "", "Unknown")
+    
+    # Several streets can resolve to one parcel; fetch each PID's summary once.
+    # (lru_cache alone would not stop two workers missing on the same PID at once.)
+    streets_by_pid = {}
+    for street, pid in resolved.items():
+        streets_by_pid.setdefault(pid, []).append(street)
+    
+    logging.info("Fetching %d SCOUT summaries (%d concurrent)...", len(streets_by_pid), SCOUT_MAX_WORKERS)
+    with ThreadPoolExecutor(max_workers=SCOUT_MAX_WORKERS) as executor:
+        futures = {executor.submit(legal_for_pid, pid): pid for pid in streets_by_pid}
+        for future in as_completed(futures):
+            pid = futures[future]
+            try:
+                summary = future.result()
+            except Exception as e:
+                for street in streets_by_pid[pid]:
+                    logging.error("→ Unexpected error looking up %s: %s", street, str(e))
+                continue
+            for street in streets_by_pid[pid]:
+                records[street] = (pid, *summary)
+    
+    return records
+
+def extract_legal_descriptions(texts: pd.Series) -> pd.Series:
+    """Cut each SCOUT page text down to the legal description between 'Active' and 'Appraisal'.
     
-    return "", "", "Unknown"
+    Pages without that section keep their whole (stripped) text.
+    """
+    return texts.str.extract(LEGAL_DESC_RE, expand=False).fillna(texts).str.strip()
 
-def should_skip_property(legal_desc: str) -> bool:
-    """Check if property should be skipped based on Aaron's filter criteria."""
-    upper_desc = legal_desc.upper()
-    return "SHORT PLAT" in upper_desc or "LONG PLAT" in upper_desc
+def should_skip_property(legal_descriptions: pd.Series) -> pd.Series:
+    """Flag properties to skip based on Aaron's filter criteria (short/long plats)."""
+    return legal_descriptions.str.contains(PLAT_RE)
 
 def extract_square_footage(text: str) -> int:
     """Extract square footage from SCOUT full page text."""
     # Pattern to match "Dwelling YEAR SQFT NA SF" format
     # Example: "Dwelling 1959 1,920 NA SF" -> extracts 1920
-    dwelling_pattern = re.compile(r'Dwelling\s+\d{4}\s+([\d,]+)\s+NA\s+SF', re.IGNORECASE)
-    match = dwelling_pattern.search(text)
+    match = SCOUT_DWELLING_RE.search(text)
     
     if match:
         sqft_str = match.group(1).replace(',', '')  # Remove commas
@@ -1582,8 +1664,7 @@ def extract_square_footage(text: str) -> int:
     
     # Fallback pattern for "Gross Living Area" if the above doesn't work
     # Look for patterns like "Gross Living Area 1,920"
-    gross_pattern = re.compile(r'Gross\s+Living\s+Area\s+([\d,]+)', re.IGNORECASE)
-    match = gross_pattern.search(text)
+    match = SCOUT_GROSS_RE.search(text)
     
     if match:
         sqft_str = match.group(1).replace(',', '')
@@ -1594,179 +1675,296 @@ def extract_square_footage(text: str) -> int:
     
     return 0  # Return 0 if no square footage found
 
-def extract_unique_lot_numbers(text: str) -> set[str]:
-    """Extract unique lot numbers from text, handling L-, L , and L& patterns."""
-    upper_text = text.upper()
-    lot_numbers = set()
-    
-    # Pattern to match lot numbers with various separators
-    # Matches: L1, L-1, L 1, L&1, etc.
-    lot_pattern = re.compile(r'\bL[-\s&]*(\d{1,2})\b')
+def scan_lot_references(up: str) -> tuple[set[str], int]:
+    """Scan upper-cased text for lot numbers and dash-style lot references.
     
-    for match in lot_pattern.finditer(upper_text):
-        lot_num = match.group(1)
-        lot_numbers.add(f"L{lot_num}")
-    
-    return lot_numbers
+    Returns the unique lot labels (L1, L-1, L 1 and L&1 all give "L1"; only a standalone
+    1-2 digit "L<n>" word counts) and the number of L<digits> runs joined only by dashes
+    or whitespace.
+    """
+    lots = {f"L{digits}" for digits in LOT_NUMBER_RE.findall(up)}
+    dashes = sum(1 for separators in LOT_RUN_RE.findall(up) if "&" not in separators)
+    return lots, dashes
 
 def enhanced_kw_counts(text: str, sqft: int = 0) -> dict[str,int]:
     """Enhanced keyword counting with improved lot number handling per Aaron's requirements."""
     up = text.upper()
-    counts = {}
-    
-    # Handle regular keywords from KEYWORDS_BASE (excluding commented out ones)
-    for keyword in KEYWORDS_BASE:
-        if keyword == " TO ":
-            # Ensure "TO" has spaces on both sides
-            counts["TO"] = up.count(keyword)
-        elif keyword == "&":
-            # Count & symbols, but be careful with lot contexts
-            counts[keyword] = up.count(keyword)
-        else:
-            counts[keyword] = up.count(keyword)
-    
-    # Handle lot numbers with deduplication
-    unique_lots = extract_unique_lot_numbers(text)
-    
-    # Initialize all lot counts to 0
-    for i in range(100):
-        lot_key = f"L{i}"
-        counts[lot_key] = 0
-    
-    # Count each unique lot number only once
-    for lot in unique_lots:
+
+    # str.count runs each search in C, so a handful of full passes is still far
+    # cheaper than one Python-level walk over every match position.
+    # " TO " is reported as "TO" (the spaces only ensure a standalone word)
+    counts = {column: up.count(keyword) for keyword, column in KEYWORD_COLUMNS.items()}
+
+    # Lot numbers are deduplicated: each unique L0 … L99 counts once. Dashes are
+    # only counted in context, next to L, from the same scan.
+    lots, dashes = scan_lot_references(up)
+    counts.update(ZERO_LOTS)
+    for lot in lots:
         if lot in counts:
             counts[lot] = 1
-    
-    # Handle dash context - only count when next to L
-    dash_with_l_pattern = re.compile(r'L[-\s]*\d+')
-    dash_matches = len(dash_with_l_pattern.findall(up))
-    counts["-"] = dash_matches
-    
+    counts["-"] = dashes
+
     return counts
 
 
 
+def keyword_count_frame(texts: pd.Series) -> pd.DataFrame:
+    """Build the keyword/lot count columns for a column of SCOUT page texts."""
+    # Counts are small non-negative integers; uint16 keeps the block a quarter of int64
+    # (int8 would overflow on the dash count of a long page). Each property's counts are
+    # written straight into its row of one preallocated C-ordered matrix that pandas
+    # wraps without copying, so no per-row tuples pile up before the block is built.
+    row_values = operator.itemgetter(*KEYWORD_COUNT_COLUMNS)
+    matrix = np.zeros((len(texts), len(KEYWORD_COUNT_COLUMNS)), dtype=np.uint16)
+    for i, text in enumerate(texts):
+        matrix[i] = row_values(enhanced_kw_counts(text))
+    return pd.DataFrame(matrix, index=texts.index, columns=KEYWORD_COUNT_COLUMNS, copy=False)
+
+def keyword_block(df: pd.DataFrame, cols: list[str]) -> np.ndarray:
+    """Return the given count columns as one C-contiguous uint16 matrix for bulk reductions."""
+    return np.ascontiguousarray(df[cols].to_numpy(dtype=np.uint16))
+
+def truncate_text(values: pd.Series, width: int) -> pd.Series:
+    """Cut strings longer than width down to width characters plus '...'."""
+    return values.where(values.str.len() <= width, values.str.slice(0, width) + '...')
+
 def create_keyword_summary(df: pd.DataFrame) -> pd.DataFrame:
     """Create a summary of only properties with non-zero keyword counts."""
-    keyword_cols = [col for col in df.columns if col in KEYWORDS]
-    
-    # Create rows for properties that have at least one keyword match
-    summary_rows = []
-    for _, row in df.iterrows():
-        found_keywords = {}
-        for kw in keyword_cols:
-            if row[kw] > 0:
-                found_keywords[kw] = row[kw]
-        
-        if found_keywords:  # Only include if there are non-zero keywords
-            summary_row = {
-                'street': row['street'],
-                'pid': row['pid'],
-                'legal_description': row['legal_description'][:100] + '...' if len(row['legal_description']) > 100 else row['legal_description'],
-                'total_keyword_matches': sum(found_keywords.values()),
-                'keywords_found': ', '.join([f"{k}({v})" for k, v in found_keywords.items()])
-            }
-            summary_rows.append(summary_row)
-    
-    return pd.DataFrame(summary_rows) if summary_rows else pd.DataFrame()
+    keyword_cols = [col for col in df.columns if col in KEYWORD_SET]
+    
+    # Keep only properties that have at least one keyword match
+    counts = keyword_block(df, keyword_cols)
+    row_mask = counts.any(axis=1)
+    if not row_mask.any():
+        return pd.DataFrame()
+    
+    hits = counts[row_mask]
+    legal = pd.Series(df['legal_description'].to_numpy()[row_mask])
+    return pd.DataFrame({
+        'street': df['street'].to_numpy()[row_mask],
+        'pid': df['pid'].to_numpy()[row_mask],
+        'legal_description': truncate_text(legal, 100),
+        'total_keyword_matches': hits.sum(axis=1),  # counts are never negative
+        'keywords_found': [', '.join(f"{keyword_cols[j]}({row[j]})" for j in np.flatnonzero(row > 0))
+                           for row in hits],
+    })
 
 def create_keyword_stats(df: pd.DataFrame) -> pd.DataFrame:
     """Create aggregate statistics for all keywords."""
-    keyword_cols = [col for col in df.columns if col in KEYWORDS]
-    
-    stats = []
-    for kw in keyword_cols:
-        total_count = df[kw].sum()
-        properties_with_kw = (df[kw] > 0).sum()
-        if total_count > 0:  # Only include keywords that appear
-            stats.append({
-                'keyword': kw,
-                'total_occurrences': total_count,
-                'properties_with_keyword': properties_with_kw,
-                'avg_per_property': round(total_count / len(df), 2),
-                'max_in_single_property': df[kw].max()
-            })
+    keyword_cols = [col for col in df.columns if col in KEYWORD_SET]
+    
+    counts = keyword_block(df, keyword_cols)
+    totals = counts.sum(axis=0)
+    mask = totals > 0  # Only include keywords that appear
+    if not mask.any():
+        return pd.DataFrame()
+    
+    stats_df = pd.DataFrame({
+        'keyword': np.array(keyword_cols, dtype=object)[mask],
+        'total_occurrences': totals[mask],
+        'properties_with_keyword': np.count_nonzero(counts, axis=0)[mask],
+        'avg_per_property': np.round(totals[mask] / len(df), 2),
+        'max_in_single_property': counts.max(axis=0)[mask],
+    })
     
     # Sort by total occurrences descending
-    stats_df = pd.DataFrame(stats)
-    if not stats_df.empty:
-        stats_df = stats_df.sort_values('total_occurrences', ascending=False)
-    
-    return stats_df
+    return stats_df.sort_values('total_occurrences', ascending=False)
 
 def create_lot_analysis(df: pd.DataFrame) -> pd.DataFrame:
     """Create analysis specifically for L0-L99 lot keywords with enhanced property details."""
-    lot_cols = [f"L{i}" for i in range(100)]
-    existing_lot_cols = [col for col in lot_cols if col in df.columns]
-    
-    analysis = []
-    for _, row in df.iterrows():
-        lot_matches = []
-        total_lots = 0
-        for lot_col in existing_lot_cols:
-            if row[lot_col] > 0:
-                lot_matches.append(f"{lot_col}({row[lot_col]})")
-                total_lots += row[lot_col]
+    existing_lot_cols = [col for col in LOT_KEYWORDS if col in df.columns]
+    
+    # Only include properties with lot matches
+    lots = keyword_block(df, existing_lot_cols)
+    found = lots > 0
+    row_has = found.any(axis=1)
+    if not row_has.any():
+        return pd.DataFrame()
+    
+    lots, found = lots[row_has], found[row_has]
+    prices = df['price'].to_numpy()[row_has]
+    acres = df['lot_size_acres'].to_numpy()[row_has]
+    legal = pd.Series(df['legal_description'].to_numpy()[row_has])
+    return pd.DataFrame({
+        'street': df['street'].to_numpy()[row_has],
+        'pid': df['pid'].to_numpy()[row_has],
+        # Format price nicely / acres with 3 decimal places
+        'price': [f"${price:,}" if price > 0 else "N/A" for price in prices],
+        'acres': [f"{acre:.3f}" if acre > 0 else "N/A" for acre in acres],
+        'legal_description': truncate_text(legal, 150),
+        'total_lot_references': lots.sum(axis=1),  # unfound lots are already 0
+        'lot_numbers_found': [', '.join(f"{existing_lot_cols[j]}({row[j]})" for j in np.flatnonzero(row_found))
+                              for row, row_found in zip(lots, found)],
+        'unique_lots_count': found.sum(axis=1),
+    })
+
+def write_excel_report(df: pd.DataFrame, summary_df: pd.DataFrame, stats_df: pd.DataFrame,
+                       lot_df: pd.DataFrame, overview_data: dict, out: Path):
+    """Write the multi-sheet Excel workbook (raw data, Redfin fields, keyword sheets, overview)."""
+    # xlsxwriter is much faster than openpyxl for write-only workbooks.
+    # constant_memory is left off: pandas writes each sheet column by column,
+    # and that mode only accepts cells in row order. strings_to_urls=False skips
+    # the per-cell URL regex check and keeps listing links as plain text.
+    with pd.ExcelWriter(out, engine='xlsxwriter',
+                        engine_kwargs={'options': {'strings_to_urls': False}}) as writer:
+        # Original detailed data
+        df.to_excel(writer, sheet_name='Raw Data', index=False)
         
-        if lot_matches:  # Only include properties with lot matches
-            # Format price nicely
-            price_str = f"${row['price']:,}" if row['price'] > 0 else "N/A"
-            # Format acres with 3 decimal places
-            acres_str = f"{row['lot_size_acres']:.3f}" if row['lot_size_acres'] > 0 else "N/A"
-            
-            analysis.append({
-                'street': row['street'],
-                'pid': row['pid'],
-                'price': price_str,
-                'acres': acres_str,
-                'legal_description': row['legal_description'][:150] + '...' if len(row['legal_description']) > 150 else row['legal_description'],
-                'total_lot_references': total_lots,
-                'lot_numbers_found': ', '.join(lot_matches),
-                'unique_lots_count': len(lot_matches)
-            })
-    
-    return pd.DataFrame(analysis) if analysis else pd.DataFrame()
+        # Create All Redfin Fields sheet with comprehensive property data
+        all_redfin_columns = [
+            'street', 'price', 'sqft', 'lot_size_acres', 'bedrooms', 'bathrooms', 
+            'property_type', 'year_built', 'days_on_market', 'post_date',
+            'mls_number', 'hoa_fee', 'property_taxes', 'stories', 'basement',
+            'heating_cooling', 'flooring', 'appliances', 'fireplace', 'pool_spa',
+            'view', 'listing_agent', 'listing_status', 'price_per_sqft',
+            'school_district', 'utilities', 'neighborhood', 'open_house',
+            'previous_price', 'walk_score', 'monthly_payment', 'photo_count',
+            'fence', 'garage_parking', 'source', 'jurisdiction'
+        ]
+        
+        # Select only the columns that exist in the dataframe
+        existing_columns = [col for col in all_redfin_columns if col in df.columns]
+        
+        # Reorder columns to put most important ones first
+        priority_columns = ['street', 'price', 'sqft', 'bedrooms', 'bathrooms', 'property_type', 'year_built', 'post_date']
+        other_columns = [col for col in existing_columns if col not in priority_columns]
+        ordered_columns = [col for col in priority_columns if col in existing_columns] + other_columns
+        
+        # One selection in final order; the sheet is write-only so no copy is needed
+        all_redfin_df = df[ordered_columns]
+        all_redfin_df.to_excel(writer, sheet_name='All Redfin Fields', index=False)
+        logging.info("Created All Redfin Fields sheet with %d properties and %d fields", len(all_redfin_df), len(ordered_columns))
+        
+        # Keyword Summary - only properties with matches
+        if not summary_df.empty:
+            summary_df.to_excel(writer, sheet_name='Keyword Summary', index=False)
+            logging.info("Created Keyword Summary with %d properties", len(summary_df))
+        
+        # Keyword Statistics - aggregate analysis
+        if not stats_df.empty:
+            stats_df.to_excel(writer, sheet_name='Keyword Stats', index=False)
+            logging.info("Created Keyword Stats with %d keywords", len(stats_df))
+        
+        # Lot Analysis - specific to L0-L99
+        if not lot_df.empty:
+            lot_df.to_excel(writer, sheet_name='Lot Analysis', index=False)
+            logging.info("Created Lot Analysis with %d properties", len(lot_df))
+        
+
+        
+        # Overview sheet
+        overview_df = pd.DataFrame({'Metric': list(overview_data), 'Value': list(overview_data.values())}, dtype=object)
+        overview_df.to_excel(writer, sheet_name='Overview', index=False)
+
+    logging.info("Wrote %s (%d rows) with enhanced visualizations", out, len(df))
+
+@lru_cache(maxsize=None)
+def pdf_styles() -> dict:
+    """Build the PDF report's paragraph and table styles once per process.
+    
+    ReportLab is imported here and in the PDF helpers rather than at module load,
+    so runs that never render a PDF (--help, the --schedule idle loop) skip it.
+    """
+    from reportlab.lib import colors
+    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+    from reportlab.platypus import TableStyle
+    
+    sheet = getSampleStyleSheet()
+    # Grey header row, beige body, full grid; each table adds its own fonts and alignment
+    table_base = [
+        ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
+        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+        ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
+        ('GRID', (0, 0), (-1, -1), 1, colors.black),
+    ]
+    return {
+        'heading': sheet['Heading2'],
+        'normal': sheet['Normal'],
+        'title': ParagraphStyle(
+            'CustomTitle',
+            parent=sheet['Heading1'],
+            fontSize=28,
+            spaceAfter=30,
+            alignment=1  # Center
+        ),
+        'footer': ParagraphStyle(
+            'Footer',
+            parent=sheet['Normal'],
+            fontSize=10,
+            alignment=1  # Center
+        ),
+        'overview_table': TableStyle(table_base + [
+            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+            ('FONTSIZE', (0, 0), (-1, 0), 14),
+            ('FONTSIZE', (0, 1), (-1, -1), 12),
+            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE')
+        ]),
+        'summary_table': TableStyle(table_base + [
+            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+            ('ALIGN', (3, 0), (3, -1), 'CENTER'),
+            ('FONTSIZE', (0, 0), (-1, 0), 11),
+            ('FONTSIZE', (0, 1), (-1, -1), 9),
+            ('VALIGN', (0, 0), (-1, -1), 'TOP')
+        ]),
+        'stats_table': TableStyle(table_base + [
+            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+            ('ALIGN', (0, 1), (0, -1), 'LEFT'),  # Left align keyword names
+            ('FONTSIZE', (0, 0), (-1, 0), 11),
+            ('FONTSIZE', (0, 1), (-1, -1), 10),
+            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE')
+        ]),
+        'lot_table': TableStyle(table_base + [
+            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+            ('ALIGN', (2, 0), (3, -1), 'CENTER'),  # Center the numeric columns
+            ('FONTSIZE', (0, 0), (-1, 0), 11),
+            ('FONTSIZE', (0, 1), (-1, -1), 9),
+            ('VALIGN', (0, 0), (-1, -1), 'TOP')
+        ]),
+    }
+
+def pdf_tables(header: list[str], rows, col_widths: list[float], style):
+    """Lay out table rows as consecutive Tables of PDF_TABLE_CHUNK_ROWS rows, each with the header.
+    
+    ReportLab re-measures every remaining row each time it splits a Table across a
+    page, so one big table gets slower than linearly; fixed-size chunks keep it linear.
+    """
+    from reportlab.platypus import Table
+    
+    rows = iter(rows)
+    while chunk := list(islice(rows, PDF_TABLE_CHUNK_ROWS)):
+        yield Table([header, *chunk], colWidths=col_widths, style=style)
 
 def create_pdf_report(df: pd.DataFrame, summary_df: pd.DataFrame, stats_df: pd.DataFrame, 
-                     lot_df: pd.DataFrame, overview_data: dict, pdf_path: Path):
-    """Create a comprehensive landscape PDF report with full contents of each Excel sheet."""
+                     lot_df: pd.DataFrame, overview_data: dict, pdf_path: Path,
+                     generated_at: dt.datetime | None = None):
+    """Create a comprehensive landscape PDF report with full contents of each Excel sheet.
+    
+    generated_at is the footer timestamp (defaults to now).
+    """
+    from reportlab.lib.pagesizes import letter, landscape
+    from reportlab.lib.units import inch
+    from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, PageBreak
+    
+    styles = pdf_styles()
     doc = SimpleDocTemplate(str(pdf_path), pagesize=landscape(letter))
-    styles = getSampleStyleSheet()
     story = []
     
     # Define available width for landscape layout
     page_width = landscape(letter)[0] - 2*inch  # Account for margins
     
     # Title
-    title_style = ParagraphStyle(
-        'CustomTitle',
-        parent=styles['Heading1'],
-        fontSize=28,
-        spaceAfter=30,
-        alignment=1  # Center
-    )
-    story.append(Paragraph("Spokane Real Estate Scout Report", title_style))
+    story.append(Paragraph("Spokane Real Estate Scout Report", styles['title']))
     story.append(Spacer(1, 20))
     
     # ═══════════════════════════════════════════════════════════════════════════════
     # 1. EXECUTIVE SUMMARY
     # ═══════════════════════════════════════════════════════════════════════════════
-    story.append(Paragraph("Executive Summary", styles['Heading2']))
+    story.append(Paragraph("Executive Summary", styles['heading']))
     overview_table_data = [['Metric', 'Value']] + [[k, str(v)] for k, v in overview_data.items()]
     overview_table = Table(overview_table_data, colWidths=[4*inch, 3*inch])
-    overview_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, 0), 14),
-        ('FONTSIZE', (0, 1), (-1, -1), 12),
-        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-        ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
-        ('GRID', (0, 0), (-1, -1), 1, colors.black),
-        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE')
-    ]))
+    overview_table.setStyle(styles['overview_table'])
     story.append(overview_table)
     story.append(PageBreak())
     
@@ -1774,149 +1972,81 @@ def create_pdf_report(df: pd.DataFrame, summary_df: pd.DataFrame, stats_df: pd.D
     # 2. KEYWORD SUMMARY - FULL SHEET CONTENTS
     # ═══════════════════════════════════════════════════════════════════════════════
     if not summary_df.empty:
-        story.append(Paragraph("Keyword Summary - All Properties with Matches", styles['Heading2']))
-        story.append(Paragraph(f"Total properties with keyword matches: {len(summary_df)}", styles['Normal']))
+        story.append(Paragraph("Keyword Summary - All Properties with Matches", styles['heading']))
+        story.append(Paragraph(f"Total properties with keyword matches: {len(summary_df)}", styles['normal']))
         story.append(Spacer(1, 15))
         
-        # Full keyword summary table (excluding legal description for PDF clarity)
-        summary_data = [['Street', 'PID', 'Total Matches', 'Keywords Found']]
-        for _, row in summary_df.iterrows():
-            # Truncate long text for PDF display
-            street = row['street'][:40] + '...' if len(row['street']) > 40 else row['street']
-            pid = str(row['pid'])[:15] + '...' if len(str(row['pid'])) > 15 else str(row['pid'])
-            # Increased space for keywords since we removed legal description
-            keywords = row['keywords_found'][:65] + '...' if len(row['keywords_found']) > 65 else row['keywords_found']
-            
-            summary_data.append([
-                street,
-                pid,
-                str(row['total_keyword_matches']),
-                keywords
-            ])
-        
+        # Full keyword summary table (excluding legal description for PDF clarity);
+        # long text is truncated for PDF display, with more room for keywords
+        summary_display = pd.DataFrame({
+            'street': truncate_text(summary_df['street'], 40),
+            'pid': truncate_text(summary_df['pid'].astype(str), 15),
+            'total_keyword_matches': summary_df['total_keyword_matches'].astype(str),
+            'keywords_found': truncate_text(summary_df['keywords_found'], 65),
+        })
         # Recalculated column widths for better use of space
-        summary_table = Table(summary_data, colWidths=[3*inch, 1.5*inch, 1*inch, 4*inch])
-        summary_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('ALIGN', (3, 0), (3, -1), 'CENTER'),  # Center the total matches column
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, 0), 11),
-            ('FONTSIZE', (0, 1), (-1, -1), 9),
-            ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-            ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
-            ('GRID', (0, 0), (-1, -1), 1, colors.black),
-            ('VALIGN', (0, 0), (-1, -1), 'TOP')
-        ]))
-        story.append(summary_table)
+        story.extend(pdf_tables(['Street', 'PID', 'Total Matches', 'Keywords Found'],
+                                summary_display.itertuples(index=False, name=None),
+                                [3*inch, 1.5*inch, 1*inch, 4*inch], styles['summary_table']))
         story.append(PageBreak())
     
     # ═══════════════════════════════════════════════════════════════════════════════
     # 3. KEYWORD STATISTICS - FULL SHEET CONTENTS
     # ═══════════════════════════════════════════════════════════════════════════════
     if not stats_df.empty:
-        story.append(Paragraph("Keyword Statistics - Complete Analysis", styles['Heading2']))
-        story.append(Paragraph(f"All keywords found across {len(df)} properties, sorted by frequency", styles['Normal']))
+        story.append(Paragraph("Keyword Statistics - Complete Analysis", styles['heading']))
+        story.append(Paragraph(f"All keywords found across {len(df)} properties, sorted by frequency", styles['normal']))
         story.append(Spacer(1, 15))
         
         # Full keyword stats table
-        stats_data = [['Keyword', 'Total Occurrences', 'Properties with Keyword', 'Avg per Property', 'Max in Single Property']]
-        for _, row in stats_df.iterrows():
-            stats_data.append([
-                row['keyword'],
-                str(row['total_occurrences']),
-                str(row['properties_with_keyword']),
-                str(row['avg_per_property']),
-                str(row['max_in_single_property'])
-            ])
-        
-        stats_table = Table(stats_data, colWidths=[2*inch, 1.5*inch, 1.8*inch, 1.5*inch, 1.7*inch])
-        stats_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-            ('ALIGN', (0, 1), (0, -1), 'LEFT'),  # Left align keyword names
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, 0), 11),
-            ('FONTSIZE', (0, 1), (-1, -1), 10),
-            ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-            ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
-            ('GRID', (0, 0), (-1, -1), 1, colors.black),
-            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE')
-        ]))
-        story.append(stats_table)
+        story.extend(pdf_tables(['Keyword', 'Total Occurrences', 'Properties with Keyword', 'Avg per Property', 'Max in Single Property'],
+                                stats_df.astype(str).itertuples(index=False, name=None),
+                                [2*inch, 1.5*inch, 1.8*inch, 1.5*inch, 1.7*inch], styles['stats_table']))
         story.append(PageBreak())
     
     # ═══════════════════════════════════════════════════════════════════════════════
     # 4. LOT ANALYSIS - FULL SHEET CONTENTS
     # ═══════════════════════════════════════════════════════════════════════════════
     if not lot_df.empty:
-        story.append(Paragraph("Lot Number Analysis - Complete Details", styles['Heading2']))
-        story.append(Paragraph(f"All {len(lot_df)} properties with specific lot number references", styles['Normal']))
+        story.append(Paragraph("Lot Number Analysis - Complete Details", styles['heading']))
+        story.append(Paragraph(f"All {len(lot_df)} properties with specific lot number references", styles['normal']))
         story.append(Spacer(1, 15))
         
         # Full lot analysis table
-        lot_data = [['Street', 'PID', 'Total Lot References', 'Unique Lots Count', 'Lot Numbers Found']]
-        for _, row in lot_df.iterrows():
-            street = row['street'][:40] + '...' if len(row['street']) > 40 else row['street']
-            pid = str(row['pid'])[:15] + '...' if len(str(row['pid'])) > 15 else str(row['pid'])
-            lot_numbers = row['lot_numbers_found'][:50] + '...' if len(row['lot_numbers_found']) > 50 else row['lot_numbers_found']
-            
-            lot_data.append([
-                street,
-                pid,
-                str(row['total_lot_references']),
-                str(row['unique_lots_count']),
-                lot_numbers
-            ])
-        
-        lot_table = Table(lot_data, colWidths=[2.5*inch, 1.3*inch, 1.3*inch, 1.2*inch, 3.2*inch])
-        lot_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('ALIGN', (2, 0), (3, -1), 'CENTER'),  # Center the numeric columns
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, 0), 11),
-            ('FONTSIZE', (0, 1), (-1, -1), 9),
-            ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-            ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
-            ('GRID', (0, 0), (-1, -1), 1, colors.black),
-            ('VALIGN', (0, 0), (-1, -1), 'TOP')
-        ]))
-        story.append(lot_table)
+        lot_display = pd.DataFrame({
+            'street': truncate_text(lot_df['street'], 40),
+            'pid': truncate_text(lot_df['pid'].astype(str), 15),
+            'total_lot_references': lot_df['total_lot_references'].astype(str),
+            'unique_lots_count': lot_df['unique_lots_count'].astype(str),
+            'lot_numbers_found': truncate_text(lot_df['lot_numbers_found'], 50),
+        })
+        story.extend(pdf_tables(['Street', 'PID', 'Total Lot References', 'Unique Lots Count', 'Lot Numbers Found'],
+                                lot_display.itertuples(index=False, name=None),
+                                [2.5*inch, 1.3*inch, 1.3*inch, 1.2*inch, 3.2*inch], styles['lot_table']))
     
     # Footer
     story.append(Spacer(1, 30))
-    footer_style = ParagraphStyle(
-        'Footer',
-        parent=styles['Normal'],
-        fontSize=10,
-        alignment=1  # Center
-    )
-    story.append(Paragraph(f"Report generated on {dt.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}", footer_style))
-    story.append(Paragraph("This report contains complete data from all Excel sheets (excluding raw data)", footer_style))
+    story.append(Paragraph(f"Report generated on {(generated_at or dt.datetime.now()):%Y-%m-%d %H:%M:%S}", styles['footer']))
+    story.append(Paragraph("This report contains complete data from all Excel sheets (excluding raw data)", styles['footer']))
     
     doc.build(story)
     logging.info("Created comprehensive landscape PDF report: %s", pdf_path)
 
-def create_test_email_file(excel_path: Path, pdf_path: Path, stats_summary: dict):
-    """Create a local HTML file showing what the email would look like."""
-    email_html = f"""
+# Local stand-in for the report email, written in test mode instead of sending
+EMAIL_PREVIEW_TEMPLATE = Template("""
     <!DOCTYPE html>
     <html>
     <head>
         <title>Test Email Preview</title>
         <style>
-            body {{ font-family: Arial, sans-serif; margin: 20px; }}
-            .email-container {{ border: 1px solid #ccc; padding: 20px; background: #f9f9f9; }}
-            .header {{ background: #4CAF50; color: white; padding: 10px; text-align: center; }}
-            .summary {{ background: #e8f5e9; padding: 15px; margin: 10px 0; }}
-            .attachments {{ background: #fff3e0; padding: 15px; margin: 10px 0; }}
-            ul {{ list-style-type: none; padding: 0; }}
-            li {{ margin: 5px 0; }}
-            .file {{ color: #1976d2; font-weight: bold; }}
+            body { font-family: Arial, sans-serif; margin: 20px; }
+            .email-container { border: 1px solid #ccc; padding: 20px; background: #f9f9f9; }
+            .header { background: #4CAF50; color: white; padding: 10px; text-align: center; }
+            .summary { background: #e8f5e9; padding: 15px; margin: 10px 0; }
+            .attachments { background: #fff3e0; padding: 15px; margin: 10px 0; }
+            ul { list-style-type: none; padding: 0; }
+            li { margin: 5px 0; }
+            .file { color: #1976d2; font-weight: bold; }
         </style>
     </head>
     <body>
@@ -1924,7 +2054,7 @@ def create_test_email_file(excel_path: Path, pdf_path: Path, stats_summary: dict
             <div class="header">
                 <h2>📧 EMAIL PREVIEW - SPOKANE REAL ESTATE SCOUT</h2>
                 <p>To: Email Recipients</p>
-                <p>Subject: Spokane Real Estate Scout Results - {dt.datetime.now().strftime('%Y-%m-%d %H:%M')}</p>
+                <p>Subject: Spokane Real Estate Scout Results - $subject_time</p>
             </div>
             
             <h3>Email Body:</h3>
@@ -1935,10 +2065,10 @@ def create_test_email_file(excel_path: Path, pdf_path: Path, stats_summary: dict
                 <div class="summary">
                     <h4>📊 SUMMARY:</h4>
                     <ul>
-                        <li>• Total properties analyzed: {stats_summary.get('total_properties', 'N/A')}</li>
-                        <li>• Properties with keywords: {stats_summary.get('properties_with_keywords', 'N/A')}</li>
-                        <li>• Unique keywords found: {stats_summary.get('unique_keywords', 'N/A')}</li>
-                        <li>• Properties with lot numbers: {stats_summary.get('properties_with_lots', 'N/A')}</li>
+                        <li>• Total properties analyzed: $total_properties</li>
+                        <li>• Properties with keywords: $properties_with_keywords</li>
+                        <li>• Unique keywords found: $unique_keywords</li>
+                        <li>• Properties with lot numbers: $properties_with_lots</li>
                     </ul>
                     
                     <h4>📖 FEATURE EXPLANATIONS:</h4>
@@ -1952,8 +2082,8 @@ def create_test_email_file(excel_path: Path, pdf_path: Path, stats_summary: dict
                 <div class="attachments">
                     <h4>📎 Attachments:</h4>
                     <ul>
-                        <li>📊 <span class="file">{excel_path.name}</span> - Excel file with 6 sheets: Raw Data, All Redfin Fields (25+ property details), Keyword Summary, Keyword Stats, Lot Analysis, and Overview</li>
-                        <li>📄 <span class="file">{pdf_path.name}</span> - PDF report with key findings and visualizations</li>
+                        <li>📊 <span class="file">$excel_name</span> - Excel file with 6 sheets: Raw Data, All Redfin Fields (25+ property details), Keyword Summary, Keyword Stats, Lot Analysis, and Overview</li>
+                        <li>📄 <span class="file">$pdf_name</span> - PDF report with key findings and visualizations</li>
                     </ul>
                 </div>
 
@@ -1964,24 +2094,44 @@ def create_test_email_file(excel_path: Path, pdf_path: Path, stats_summary: dict
                 <h4>🧪 TEST MODE ACTIVE</h4>
                 <p><strong>Files created locally:</strong></p>
                 <ul>
-                    <li>✅ <span class="file">{excel_path}</span></li>
-                    <li>✅ <span class="file">{pdf_path}</span></li>
-                    <li>📧 <span class="file">{excel_path.parent / f"test_email_{dt.datetime.now().strftime('%Y%m%d_%H%M%S')}.html"}</span> (this preview)</li>
+                    <li>✅ <span class="file">$excel_path</span></li>
+                    <li>✅ <span class="file">$pdf_path</span></li>
+                    <li>📧 <span class="file">$preview_path</span> (this preview)</li>
                 </ul>
                 <p><em>No actual email was sent. Use --send-email flag to send real emails when ready.</em></p>
             </div>
         </div>
     </body>
     </html>
-    """
-    
-    test_email_path = excel_path.parent / f"test_email_{dt.datetime.now().strftime('%Y%m%d_%H%M%S')}.html"
-    with open(test_email_path, 'w', encoding='utf-8') as f:
-        f.write(email_html)
+    """)
+
+def create_test_email_file(excel_path: Path, pdf_path: Path, stats_summary: dict):
+    """Create a local HTML file showing what the email would look like."""
+    now = dt.datetime.now()
+    test_email_path = excel_path.parent / f"test_email_{now.strftime('%Y%m%d_%H%M%S')}.html"
+    email_html = EMAIL_PREVIEW_TEMPLATE.substitute(
+        subject_time=now.strftime('%Y-%m-%d %H:%M'),
+        total_properties=stats_summary.get('total_properties', 'N/A'),
+        properties_with_keywords=stats_summary.get('properties_with_keywords', 'N/A'),
+        unique_keywords=stats_summary.get('unique_keywords', 'N/A'),
+        properties_with_lots=stats_summary.get('properties_with_lots', 'N/A'),
+        excel_name=excel_path.name,
+        pdf_name=pdf_path.name,
+        excel_path=excel_path,
+        pdf_path=pdf_path,
+        preview_path=test_email_path,
+    )
+    test_email_path.write_text(email_html, encoding='utf-8')
     
     logging.info("Created email preview: %s", test_email_path)
     return test_email_path
 
+def mask_email(address: str | None) -> str:
+    """Hide the middle of an email address for logging ("abc***@gmail.com")."""
+    if address and len(address) > 13:
+        return address[:3] + "***" + address[-10:]
+    return "***"
+
 def send_email(excel_path: Path, pdf_path: Path, stats_summary: dict, email_provider='gmail'):
     """Send email with Excel and PDF attachments."""
     # Get email credentials from environment variables
@@ -2002,13 +2152,10 @@ def send_email(excel_path: Path, pdf_path: Path, stats_summary: dict, email_prov
         recipients = ['your@email.com']  # Fallback
     
     # Debug logging for recipients
-    masked_recipients = []
-    for email in recipients:
-        masked = email[:3] + "***" + email[-10:] if len(email) > 13 else "***"
-        masked_recipients.append(masked)
+    masked_recipients = [mask_email(email) for email in recipients]
     
     logging.info("📧 Attempting to send email to: %s", ', '.join(masked_recipients))
-    logging.info("📧 Using sender email: %s", sender_email[:3] + "***" + sender_email[-10:] if sender_email and len(sender_email) > 13 else "***")
+    logging.info("📧 Using sender email: %s", mask_email(sender_email))
     
     if not sender_email or not sender_password:
         logging.error("Email credentials not found.")
@@ -2033,8 +2180,12 @@ def send_email(excel_path: Path, pdf_path: Path, stats_summary: dict, email_prov
         return False
     
     try:
+        # Only needed when actually sending
+        import smtplib
+        from email.message import EmailMessage
+        
         # Create message
-        msg = MIMEMultipart()
+        msg = EmailMessage()
         msg['From'] = sender_email
         msg['To'] = ', '.join(recipients)  # Multiple recipients
         msg['Subject'] = f"Spokane Real Estate Scout Results - {dt.datetime.now().strftime('%Y-%m-%d %H:%M')}"
@@ -2084,36 +2235,24 @@ Best regards,
 Your Real Estate Bot Assistant 🏠
         """
         
-        msg.attach(MIMEText(body, 'plain'))
-        
-        # Attach Excel file
-        logging.info("📎 Attaching Excel file: %s", excel_path.name)
-        with open(excel_path, "rb") as attachment:
-            part = MIMEBase('application', 'octet-stream')
-            part.set_payload(attachment.read())
-            encoders.encode_base64(part)
-            part.add_header('Content-Disposition', f'attachment; filename= {excel_path.name}')
-            msg.attach(part)
+        msg.set_content(body)
         
-        # Attach PDF file
-        logging.info("📎 Attaching PDF file: %s", pdf_path.name)
-        with open(pdf_path, "rb") as attachment:
-            part = MIMEBase('application', 'octet-stream')
-            part.set_payload(attachment.read())
-            encoders.encode_base64(part)
-            part.add_header('Content-Disposition', f'attachment; filename= {pdf_path.name}')
-            msg.attach(part)
+        # Attach Excel and PDF files; add_attachment base64-encodes each file
+        # through binascii and writes the Content-Disposition header itself
+        for label, path in (("Excel", excel_path), ("PDF", pdf_path)):
+            logging.info("📎 Attaching %s file: %s", label, path.name)
+            msg.add_attachment(path.read_bytes(), maintype='application',
+                               subtype='octet-stream', filename=path.name)
         
-        # Send email using provider-specific settings
+        # Send email using provider-specific settings; the context manager
+        # closes the connection even when login or sending fails
         logging.info("🔄 Connecting to %s (%s:%s)", email_provider, provider_config['smtp'], provider_config['port'])
-        server = smtplib.SMTP(provider_config['smtp'], provider_config['port'])
-        server.starttls()
-        logging.info("🔐 Logging in to email server...")
-        server.login(sender_email, sender_password)
-        text = msg.as_string()
-        logging.info("📤 Sending email...")
-        server.sendmail(sender_email, recipients, text)  # Send to multiple recipients
-        server.quit()
+        with smtplib.SMTP(provider_config['smtp'], provider_config['port']) as server:
+            server.starttls()
+            logging.info("🔐 Logging in to email server...")
+            server.login(sender_email, sender_password)
+            logging.info("📤 Sending email...")
+            server.send_message(msg, to_addrs=recipients)  # Send to multiple recipients
         
         logging.info("Email sent successfully to %s via %s", ', '.join(masked_recipients), email_provider)
         return True
@@ -2130,10 +2269,9 @@ def run_daily_report():
     # Create a mock args object for scheduled runs
     class MockArgs:
         limit = None
-        no_email = False
-        test_email = False
-        send_email = True  # Always send real emails in scheduled mode
+        email_mode = 'send'  # Always send real emails in scheduled mode
         provider = 'gmail'
+        show_raw_text = False
     
     args = MockArgs()
     
@@ -2146,35 +2284,118 @@ def run_daily_report():
 
 
 
+def next_report_time(now: dt.datetime) -> dt.datetime:
+    """Return the first REPORT_HOUR:00 wall-clock time after now, in now's timezone."""
+    run = now.replace(hour=REPORT_HOUR, minute=0, second=0, microsecond=0)
+    if run <= now:
+        run += dt.timedelta(days=1)
+    return run
+
 def run_scheduler():
     """Run the scheduling system."""
-    # Set up Pacific Time zone
-    pst = pytz.timezone('US/Pacific')
+    tz = ZoneInfo(REPORT_TIMEZONE)
     
     logging.info("🕐 Starting email automation scheduler...")
-    logging.info("📅 Reports will be sent every 3 days at 10:00 AM PST")
+    logging.info("📅 Reports will be sent every %d days at %02d:00 AM PST", REPORT_INTERVAL_DAYS, REPORT_HOUR)
     logging.info("⏸️  Press Ctrl+C to stop the scheduler")
     
-    # Schedule to run every 3 days at 10 AM PST
-    schedule.every(3).days.at("10:00").do(run_daily_report)
+    # Adding days to an aware datetime keeps the wall-clock hour, so runs stay at
+    # 10 AM local time across PST/PDT changes
+    next_run = next_report_time(dt.datetime.now(tz))
     
     try:
         while True:
-            # Check if we're in PST/PDT and adjust
-            now_pst = dt.datetime.now(pst)
-            schedule.run_pending()
-            
-            # Sleep for 1 minute between checks
-            time.sleep(60)
+            # Sleep straight toward the next run, waking at most hourly to log status.
+            # Timestamps give the real remaining time even across a DST change.
+            remaining = next_run.timestamp() - time.time()
+            if remaining > 0:
+                logging.info("🕐 Scheduler active - Next run: %s", next_run.strftime('%Y-%m-%d %H:%M %Z'))
+                time.sleep(min(remaining, 3600))
+                continue
             
-            # Log status every hour on the hour
-            if now_pst.minute == 0:
-                logging.info("🕐 Scheduler active - Next run: %s PST", 
-                           schedule.next_run().strftime('%Y-%m-%d %H:%M'))
+            run_daily_report()
+            # Skip any intervals missed while suspended (or after a clock jump) so
+            # a late wake-up sends one report, not one per missed interval
+            now = dt.datetime.now(tz)
+            while next_run <= now:
+                next_run += dt.timedelta(days=REPORT_INTERVAL_DAYS)
                 
     except KeyboardInterrupt:
         logging.info("⏹️  Scheduler stopped by user")
 
+def frame_digest(df: pd.DataFrame) -> str:
+    """Content hash of a report frame's rows, ignoring row order, the index and REPORT_VOLATILE_COLUMNS."""
+    stable = df.drop(columns=REPORT_VOLATILE_COLUMNS, errors='ignore')
+    # Sorted row hashes, so a reshuffled fetch order still counts as the same data
+    row_hashes = np.sort(pd.util.hash_pandas_object(stable, index=False).to_numpy())
+    return hashlib.blake2b(row_hashes.tobytes(), digest_size=16).hexdigest()
+
+def load_last_report() -> dict:
+    """Return the hash and file paths recorded by the previous report, or {}."""
+    try:
+        return orjson.loads(LAST_REPORT_PATH.read_bytes())
+    except (OSError, orjson.JSONDecodeError):
+        return {}
+
+def save_last_report(data_hash: str, excel_path: Path, pdf_path: Path):
+    """Record the data hash and output files of the report just written."""
+    LAST_REPORT_PATH.write_bytes(orjson.dumps(
+        {'hash': data_hash, 'excel': str(excel_path.resolve()), 'pdf': str(pdf_path.resolve())}))
+
+def process_property(prop: dict, record: tuple[str | None, str, str] | None) -> tuple[str, dict | None]:
+    """Combine a Redfin property with its prefetched SCOUT record into a report row.
+    
+    Returns ("ok", row) or ("failed", None).
+    """
+    street = prop['street']
+    if record is None:
+        return "failed", None  # Lookup raised; already logged by fetch_scout_records
+    
+    pid, full_text, jurisdiction = record
+    if not pid:
+        logging.warning("→ Skipping %s - no PID found", street)
+        return "failed", None
+    
+    # If SCOUT data completely failed, use fallback values but continue processing
+    if not full_text:
+        logging.warning("→ No SCOUT data for %s (PID: %s) - using fallback values", street, pid)
+        full_text = f"PROPERTY: {street}"  # Minimal text for keyword analysis
+        jurisdiction = "Unknown"
+    
+    # Extract lot size and square footage from SCOUT data (more reliable than Redfin)
+    scout_lot_size_acres = extract_lot_size_from_scout(full_text)
+    scout_sqft = extract_square_footage(full_text)
+    
+    # Use Redfin data as fallback if SCOUT data is missing
+    if scout_lot_size_acres == 0.0 and prop['lot_size_acres'] > 0:
+        scout_lot_size_acres = prop['lot_size_acres']
+        logging.info("→ Using Redfin lot size as fallback: %.3f acres", scout_lot_size_acres)
+        
+    if scout_sqft == 0 and prop['sqft'] > 0:
+        scout_sqft = prop['sqft']
+        logging.info("→ Using Redfin sqft as fallback: %d sqft", scout_sqft)
+    
+    logging.info("→ SCOUT data: %d sqft | %.3f acres | %s jurisdiction", 
+                scout_sqft, scout_lot_size_acres, jurisdiction)
+    
+    return "ok", {
+        "street": street,
+        "pid": pid,
+        "sqft": scout_sqft,  # SCOUT data with Redfin fallback
+        "price": prop['price'],
+        "lot_size_acres": scout_lot_size_acres,  # SCOUT data with Redfin fallback
+        "post_date": prop['post_date'],
+        "bedrooms": prop['bedrooms'],
+        "bathrooms": prop['bathrooms'],
+        "property_type": prop['property_type'],
+        "year_built": prop['year_built'],
+        "days_on_market": prop['days_on_market'],
+        "garage_parking": prop['garage_parking'],
+        "source": prop['source'],
+        "jurisdiction": jurisdiction,
+        "full_page_text": full_text,
+    }
+
 def run_main_logic(args):
     """Extract the main logic so it can be called by both CLI and scheduler."""
     
@@ -2186,13 +2407,25 @@ def run_main_logic(args):
         logging.getLogger().setLevel(logging.WARNING)
     
     # Fetch Redfin properties with enhanced data
-    properties = fetch_redfin_properties()
+    properties = fetch_redfin_properties(args.show_raw_text)
     if args.limit:
         properties = properties[:args.limit]
         logging.info("Limiting to %d properties", len(properties))
 
-    rows = []
-    skipped_count = 0
+    # SCOUT lookups are memoized so repeated streets/PIDs skip the round-trip; the
+    # in-process memo is per run, cross-run reuse comes from the expiring disk cache
+    arcgis_pid.cache_clear()
+    legal_for_pid.cache_clear()
+
+    # Resolve PIDs and SCOUT summaries up front, overlapping the network waits
+    scout_records = fetch_scout_records([prop['street'] for prop in properties])
+
+    # Collect the report column by column; the frame is built once after the loop
+    columns = {name: [] for name in (
+        "street", "pid", "legal_description", "sqft", "price", "lot_size_acres", "post_date",
+        "bedrooms", "bathrooms", "property_type", "year_built", "days_on_market",
+        "garage_parking", "source", "jurisdiction", "full_page_text",
+    )}
     failed_count = 0
     
     for i, prop in enumerate(properties,1):
@@ -2200,148 +2433,72 @@ def run_main_logic(args):
             print(f"\n🏠 PROPERTY #{i}: {prop['street']}")
             print(f"   Source: {prop['source']} | Price: ${prop['price']:,}" if prop['price'] > 0 else f"   Source: {prop['source']} | Price: N/A")
         street = prop['street']
-        redfin_sqft = prop['sqft']
         price = prop['price']
-        lot_size_acres = prop['lot_size_acres']
-        post_date = prop['post_date']
-        source = prop['source']
-        bedrooms = prop['bedrooms']
-        bathrooms = prop['bathrooms']
-        property_type = prop['property_type']
-        year_built = prop['year_built']
-        days_on_market = prop['days_on_market']
-        garage_parking = prop['garage_parking']
         
         logging.info("[%d/%d] %s (Source: %s | Price: $%s | %dBR/%sBA | %s | Posted: %s)", 
-                    i, len(properties), street, source, 
+                    i, len(properties), street, prop['source'], 
                     f"{price:,}" if price > 0 else "N/A",
-                    bedrooms, bathrooms, property_type,
-                    post_date or "N/A")
+                    prop['bedrooms'], prop['bathrooms'], prop['property_type'],
+                    prop['post_date'] or "N/A")
         
         try:
-            # Get PID with robust error handling
-            pid = arcgis_pid(street)
-            if not pid:
-                failed_count += 1
-                logging.warning("→ Skipping %s - no PID found", street)
-                continue
-                
-            # Get SCOUT data with robust error handling  
-            full_text, html, jurisdiction = legal_for_pid(pid)
-            
-            # If SCOUT data completely failed, use fallback values but continue processing
-            if not full_text:
-                logging.warning("→ No SCOUT data for %s (PID: %s) - using fallback values", street, pid)
-                full_text = f"PROPERTY: {street}"  # Minimal text for keyword analysis
-                jurisdiction = "Unknown"
-            
-            # Extract lot size and square footage from SCOUT data (more reliable than Redfin)
-            scout_lot_size_acres = extract_lot_size_from_scout(full_text)
-            scout_sqft = extract_square_footage(full_text)
-            
-            # Use Redfin data as fallback if SCOUT data is missing
-            if scout_lot_size_acres == 0.0 and lot_size_acres > 0:
-                scout_lot_size_acres = lot_size_acres
-                logging.info("→ Using Redfin lot size as fallback: %.3f acres", scout_lot_size_acres)
-                
-            if scout_sqft == 0 and redfin_sqft > 0:
-                scout_sqft = redfin_sqft
-                logging.info("→ Using Redfin sqft as fallback: %d sqft", scout_sqft)
-            
-            logging.info("→ SCOUT data: %d sqft | %.3f acres | %s jurisdiction", 
-                        scout_sqft, scout_lot_size_acres, jurisdiction)
-            
-            # Extract legal description between 'Active' and 'Appraisal'
-            legal_desc = ""
-            try:
-                if full_text:
-                    start = full_text.index("Active") + len("Active")
-                    end = full_text.index("Appraisal", start)
-                    legal_desc = full_text[start:end].strip()
-            except ValueError:
-                legal_desc = full_text.strip() if full_text else f"Property at {street}"
-            
-            # Apply Aaron's filter: skip short plat and long plat properties
-            if should_skip_property(legal_desc):
-                skipped_count += 1
-                logging.info("→ Skipped (contains short/long plat): %s", street)
-                continue
-            
-            # Create the row with all data
-            rows.append({
-                "street": street,
-                "pid": pid,
-                "legal_description": legal_desc,
-                "sqft": scout_sqft,  # SCOUT data with Redfin fallback
-                "price": price,
-                "lot_size_acres": scout_lot_size_acres,  # SCOUT data with Redfin fallback
-                "post_date": post_date,
-                "bedrooms": bedrooms,
-                "bathrooms": bathrooms,
-                "property_type": property_type,
-                "year_built": year_built,
-                "days_on_market": days_on_market,
-                "garage_parking": garage_parking,
-                "source": source,
-                "jurisdiction": jurisdiction,
-                "full_page_text": full_text,
-                **enhanced_kw_counts(full_text, scout_sqft)  # Use best available sqft for keyword analysis
-            })
-            
+            status, row = process_property(prop, scout_records.get(street))
         except Exception as e:
             failed_count += 1
             logging.error("→ Unexpected error processing %s: %s", street, str(e))
             logging.info("→ Continuing with next property...")
             continue
-            
-        time.sleep(0.3)   # polite throttle
+        
+        if status == "failed":
+            failed_count += 1
+        else:
+            for name, value in row.items():
+                columns[name].append(value)
+    
+    # Legal descriptions are cut from the page texts in one pass over the whole column
+    columns["legal_description"] = extract_legal_descriptions(pd.Series(columns["full_page_text"], dtype=object))
+    
+    # An all-empty frame would infer float columns; keep it object so the .str filters work
+    df = pd.DataFrame(columns) if columns["street"] else pd.DataFrame(columns, dtype=object)
+    
+    # Apply Aaron's filter: skip short plat and long plat properties
+    is_plat = should_skip_property(df['legal_description'])
+    for street in df.loc[is_plat, 'street']:
+        logging.info("→ Skipped (contains short/long plat): %s", street)
+    skipped_count = int(is_plat.sum())
+    df = df[~is_plat]
     
     # APPLY BOSS'S FILTERS BEFORE FINALIZING
     logging.info("═══ APPLYING BOSS'S FILTERS ═══")
-    pre_filter_count = len(rows)
+    pre_filter_count = len(df)
     
     # Log jurisdictions found before filtering
-    jurisdictions = {}
-    for row in rows:
-        jurisdiction = row['jurisdiction']
-        jurisdictions[jurisdiction] = jurisdictions.get(jurisdiction, 0) + 1
-    
     logging.info("Jurisdictions found before filtering:")
-    for jurisdiction, count in sorted(jurisdictions.items()):
+    for jurisdiction, count in df['jurisdiction'].value_counts().sort_index().items():
         logging.info("  %s: %d properties", jurisdiction, count)
     
-    # Filter 1: Remove Spokane Valley properties (check jurisdiction, source, AND street address)
-    def is_spokane_valley_property(row):
-        """Check if property is in Spokane Valley based on multiple criteria."""
-        # Check jurisdiction (from SCOUT data)
-        if 'VALLEY' in row['jurisdiction'].upper():
-            return True
-        
-        # Check source (which Redfin page it came from)
-        if 'VALLEY' in row['source'].upper():
-            return True
-            
-        # Check street address itself
-        if 'SPOKANE VALLEY' in row['street'].upper():
-            return True
-            
-        return False
-    
-    rows = [row for row in rows if not is_spokane_valley_property(row)]
-    spokane_valley_removed = pre_filter_count - len(rows)
+    # Filter 1: Remove Spokane Valley properties - check jurisdiction (from SCOUT data),
+    # source (which Redfin page it came from) AND the street address itself
+    is_spokane_valley = (
+        df['jurisdiction'].str.upper().str.contains('VALLEY', regex=False)
+        | df['source'].str.upper().str.contains('VALLEY', regex=False)
+        | df['street'].str.upper().str.contains('SPOKANE VALLEY', regex=False)
+    )
+    df = df[~is_spokane_valley]
+    spokane_valley_removed = pre_filter_count - len(df)
     if spokane_valley_removed > 0:
         logging.info("Removed %d Spokane Valley properties", spokane_valley_removed)
     
     # Filter 2: Only keep properties > 0.25 acres
-    pre_acreage_count = len(rows)
-    rows = [row for row in rows if row['lot_size_acres'] > 0.25]
-    small_lots_removed = pre_acreage_count - len(rows)
+    pre_acreage_count = len(df)
+    df = df[df['lot_size_acres'] > 0.25].reset_index(drop=True)
+    small_lots_removed = pre_acreage_count - len(df)
     if small_lots_removed > 0:
         logging.info("Removed %d properties with lots <= 0.25 acres", small_lots_removed)
     
     # Summary logging
     total_processed = len(properties)
-    successful = len(rows)
+    successful = len(df)
     
     logging.info("═══ PROCESSING SUMMARY ═══")
     logging.info("Total properties found: %d", total_processed)
@@ -2357,26 +2514,22 @@ def run_main_logic(args):
     logging.info("Final count after filters: %d", successful)
     logging.info("Success rate: %.1f%%", (successful / total_processed * 100) if total_processed > 0 else 0)
 
-    if not rows:
+    if df.empty:
         logging.error("No data collected; exiting.")
         return  # Don't sys.exit() in scheduler mode
 
-    df = pd.DataFrame(rows)
+    # Keyword/lot columns are counted only for rows that survived the filters
+    # and attached as one block instead of widening every row dict. The full SCOUT
+    # page text is only needed for the counts, so it is dropped here rather than
+    # carried through the sort, the report builders and the Raw Data sheet.
+    df = pd.concat([df.drop(columns=['full_page_text']), keyword_count_frame(df['full_page_text'])], axis=1)
     
     # SORT BY DATE - newest listings first
     logging.info("═══ SORTING BY DATE ═══")
-    # Convert post_date to datetime for proper sorting
-    def parse_date(date_str):
-        if not date_str or date_str == '':
-            return dt.datetime.min  # Put unknown dates at the end
-        try:
-            return dt.datetime.strptime(date_str, '%m/%d/%Y')
-        except:
-            return dt.datetime.min  # Fallback for invalid dates
-    
-    df['post_date_parsed'] = df['post_date'].apply(parse_date)
-    df = df.sort_values(['post_date_parsed'], ascending=[False])  # Newest first
-    df = df.drop('post_date_parsed', axis=1)  # Remove temp column
+    # Parse post_date in one vectorized pass; empty, "Unknown" and malformed dates
+    # become NaT and sort after every real date (stable, so ties keep fetch order)
+    post_dates = pd.to_datetime(df['post_date'], format='%m/%d/%Y', errors='coerce')
+    df = df.loc[post_dates.sort_values(ascending=False, na_position='last', kind='stable').index]  # Newest first
     
     logging.info("Properties sorted by date - newest listings first")
     if len(df) > 0:
@@ -2386,7 +2539,9 @@ def run_main_logic(args):
     
 
     
-    batch_id = dt.datetime.now().strftime("%Y%m%d_%H%M%S")
+    # One timestamp names the output files and stamps the PDF footer
+    run_time = dt.datetime.now()
+    batch_id = run_time.strftime("%Y%m%d_%H%M%S")
     out = Path(f"scout_results_{batch_id}.xlsx")
     pdf_out = Path(f"scout_results_{batch_id}.pdf")
     
@@ -2398,7 +2553,7 @@ def run_main_logic(args):
     # Create overview data
     overview_data = {
         'Total Properties Scraped': len(df),
-        'Total Redfin Fields Extracted': len([col for col in df.columns if col not in ['full_page_text', 'legal_description', 'pid'] + [f"L{i}" for i in range(100)] + KEYWORDS_BASE]),
+        'Total Redfin Fields Extracted': len([col for col in df.columns if col not in ['legal_description', 'pid'] + [f"L{i}" for i in range(100)] + KEYWORDS_BASE]),
         'Properties with Keywords': len(summary_df) if not summary_df.empty else 0,
         'Total Unique Keywords Found': len(stats_df) if not stats_df.empty else 0,
         'Most Common Keyword': stats_df.iloc[0]['keyword'] if not stats_df.empty else 'None',
@@ -2406,94 +2561,68 @@ def run_main_logic(args):
         'Date Generated': batch_id
     }
     
-    with pd.ExcelWriter(out, engine='openpyxl') as writer:
-        # Original detailed data
-        df.to_excel(writer, sheet_name='Raw Data', index=False)
-        
-        # Create All Redfin Fields sheet with comprehensive property data
-        all_redfin_columns = [
-            'street', 'price', 'sqft', 'lot_size_acres', 'bedrooms', 'bathrooms', 
-            'property_type', 'year_built', 'days_on_market', 'post_date',
-            'mls_number', 'hoa_fee', 'property_taxes', 'stories', 'basement',
-            'heating_cooling', 'flooring', 'appliances', 'fireplace', 'pool_spa',
-            'view', 'listing_agent', 'listing_status', 'price_per_sqft',
-            'school_district', 'utilities', 'neighborhood', 'open_house',
-            'previous_price', 'walk_score', 'monthly_payment', 'photo_count',
-            'fence', 'garage_parking', 'source', 'jurisdiction'
-        ]
-        
-        # Select only the columns that exist in the dataframe
-        existing_columns = [col for col in all_redfin_columns if col in df.columns]
-        all_redfin_df = df[existing_columns].copy()
-        
-        # Reorder columns to put most important ones first
-        priority_columns = ['street', 'price', 'sqft', 'bedrooms', 'bathrooms', 'property_type', 'year_built', 'post_date']
-        other_columns = [col for col in existing_columns if col not in priority_columns]
-        ordered_columns = [col for col in priority_columns if col in existing_columns] + other_columns
-        
-        all_redfin_df = all_redfin_df[ordered_columns]
-        all_redfin_df.to_excel(writer, sheet_name='All Redfin Fields', index=False)
-        logging.info("Created All Redfin Fields sheet with %d properties and %d fields", len(all_redfin_df), len(ordered_columns))
-        
-        # Keyword Summary - only properties with matches
-        if not summary_df.empty:
-            summary_df.to_excel(writer, sheet_name='Keyword Summary', index=False)
-            logging.info("Created Keyword Summary with %d properties", len(summary_df))
-        
-        # Keyword Statistics - aggregate analysis
-        if not stats_df.empty:
-            stats_df.to_excel(writer, sheet_name='Keyword Stats', index=False)
-            logging.info("Created Keyword Stats with %d keywords", len(stats_df))
-        
-        # Lot Analysis - specific to L0-L99
-        if not lot_df.empty:
-            lot_df.to_excel(writer, sheet_name='Lot Analysis', index=False)
-            logging.info("Created Lot Analysis with %d properties", len(lot_df))
-        
-
-        
-        # Overview sheet
-        overview_df = pd.DataFrame(list(overview_data.items()), columns=['Metric', 'Value'])
-        overview_df.to_excel(writer, sheet_name='Overview', index=False)
-
-    logging.info("Wrote %s (%d rows) with enhanced visualizations", out, len(df))
-    
-    # Create PDF report
-    create_pdf_report(df, summary_df, stats_df, lot_df, overview_data, pdf_out)
+    # Reuse the last report's files when the scraped data is unchanged (e.g. a
+    # scheduled run with no new or edited listings) instead of re-rendering them.
+    # Only the volatile columns can differ from the reused files.
+    data_hash = frame_digest(df)
+    last_report = load_last_report()
+    if (last_report.get('hash') == data_hash
+            and Path(last_report['excel']).exists() and Path(last_report['pdf']).exists()):
+        out, pdf_out = Path(last_report['excel']), Path(last_report['pdf'])
+        logging.info("♻️ Data unchanged since the last report; reusing %s and %s", out, pdf_out)
+    else:
+        # Excel and PDF are independent files built from the same read-only frames;
+        # render them side by side (xlsxwriter's zip deflate and ReportLab's page
+        # compression release the GIL) and wait for both before any email step
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            excel_job = pool.submit(write_excel_report, df, summary_df, stats_df, lot_df, overview_data, out)
+            pdf_job = pool.submit(create_pdf_report, df, summary_df, stats_df, lot_df, overview_data, pdf_out, run_time)
+            excel_job.result()
+            pdf_job.result()
+        save_last_report(data_hash, out, pdf_out)
     
     # Handle email/preview generation
-    if not args.no_email:
-        stats_summary = {
-            'total_properties': len(df),
-            'properties_with_keywords': len(summary_df) if not summary_df.empty else 0,
-            'unique_keywords': len(stats_df) if not stats_df.empty else 0,
-            'properties_with_lots': len(lot_df) if not lot_df.empty else 0
-        }
-        
-        # Test email mode (default) or real email mode
-        if args.test_email or (not args.send_email and not args.no_email):
-            # Create HTML preview by default (safest option)
+    if args.email_mode == 'skip':
+        logging.info("Email sending skipped. Files saved locally: %s, %s", out, pdf_out)
+        return
+    
+    # Row counts straight from the shapes (an empty frame already reports 0)
+    stats_summary = {
+        'total_properties': df.shape[0],
+        'properties_with_keywords': summary_df.shape[0],
+        'unique_keywords': stats_df.shape[0],
+        'properties_with_lots': lot_df.shape[0]
+    }
+    
+    if args.email_mode == 'send':
+        # Actually send email
+        email_sent = send_email(out, pdf_out, stats_summary, args.provider)
+        if not email_sent:
+            logging.info("Email not sent. Files saved locally: %s, %s", out, pdf_out)
+            # Create preview as fallback
             preview_path = create_test_email_file(out, pdf_out, stats_summary)
-            logging.info("📧 Email preview created! Open in browser: %s", preview_path)
-            logging.info("💡 To send real emails: use --send-email flag")
-        elif args.send_email:
-            # Actually send email
-            email_sent = send_email(out, pdf_out, stats_summary, args.provider)
-            if not email_sent:
-                logging.info("Email not sent. Files saved locally: %s, %s", out, pdf_out)
-                # Create preview as fallback
-                preview_path = create_test_email_file(out, pdf_out, stats_summary)
-                logging.info("📧 Email preview created as fallback: %s", preview_path)
+            logging.info("📧 Email preview created as fallback: %s", preview_path)
     else:
-        logging.info("Email sending skipped. Files saved locally: %s, %s", out, pdf_out)
+        # Create HTML preview by default (safest option)
+        preview_path = create_test_email_file(out, pdf_out, stats_summary)
+        logging.info("📧 Email preview created! Open in browser: %s", preview_path)
+        logging.info("💡 To send real emails: use --send-email flag")
 
 # ───── main ───────────────────────────────────────────────────────────────────
 def main():
     ap = argparse.ArgumentParser()
     ap.add_argument("-n","--limit",type=int,help="max properties to process")
-    ap.add_argument("--no-email", action="store_true", help="skip sending email")
-    ap.add_argument("--test-email", action="store_true", help="create HTML preview instead of sending email")
-    ap.add_argument("--send-email", action="store_true", help="force send real email (overrides test mode)")
+    # One email mode per run; the legacy flags are shorthands for --email-mode values,
+    # and argparse rejects conflicting combinations up front
+    email = ap.add_mutually_exclusive_group()
+    email.add_argument("--email-mode", choices=['preview', 'send', 'skip'], default='preview',
+                       help="preview: write an HTML preview (default), send: send real email, skip: files only")
+    email.add_argument("--no-email", dest="email_mode", action="store_const", const='skip',
+                       help="skip sending email (same as --email-mode skip)")
+    email.add_argument("--test-email", dest="email_mode", action="store_const", const='preview',
+                       help="create HTML preview instead of sending email (same as --email-mode preview)")
+    email.add_argument("--send-email", dest="email_mode", action="store_const", const='send',
+                       help="send real email (same as --email-mode send)")
     ap.add_argument("--provider", choices=['gmail', 'outlook', 'yahoo', 'aol'], default='gmail',
                     help="email provider to use (default: gmail)")
 